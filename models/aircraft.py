@@ -5,7 +5,7 @@ from dataclasses import dataclass, field
 from typing import Optional, List
 
 
-@dataclass
+@dataclass(slots=True)
 class Aircraft:
     """Represents an aircraft in the simulation"""
     callsign: str
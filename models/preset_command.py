@@ -5,11 +5,11 @@ This module defines the data model for preset command rules that can be applied
 to groups of aircraft in vNAS scenarios.
 """
 
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from typing import Optional
 
 
-@dataclass
+@dataclass(slots=True)
 class PresetCommandRule:
     """
     Represents a preset command rule that applies a vNAS command to a group of aircraft.
@@ -29,10 +29,13 @@ class PresetCommandRule:
         group_value: Value for the group filter (e.g., "AAL" for airline, "PINNG1" for STAR, "5" for random count).
                     Not used for "all", "departures", "arrivals".
         command_template: vNAS command with optional variables (e.g., "SAYF THIS IS $aid")
+        match_value: group_value normalized for matching (upper case, equipment suffix
+                    removed for aircraft_type). Derived in __post_init__.
     """
     group_type: str
     group_value: Optional[str]
     command_template: str
+    match_value: str = field(init=False, repr=False, compare=False)
 
     def __post_init__(self):
         """Validate the preset command rule"""
@@ -52,6 +55,12 @@ class PresetCommandRule:
         if not self.command_template:
             raise ValueError("command_template cannot be empty")
 
+        # Normalize the group value once instead of on every aircraft comparison
+        match_value = (self.group_value or "").upper()
+        if self.group_type == "aircraft_type":
+            match_value = match_value.split('/')[0]
+        self.match_value = match_value
+
     def to_dict(self) -> dict:
         """Convert to dictionary for serialization"""
         return {
@@ -3,6 +3,7 @@ Parser for airport GeoJSON files
 """
 import json
 import logging
+from collections import defaultdict
 from typing import List, Dict, Optional
 from models.airport import ParkingSpot, Runway
 from utils.airport_utils import get_airport_elevation
@@ -311,13 +312,10 @@ class GeoJSONParser:
             groups[runway_end] = root_to_group_id[root]
 
         # Log the groups with relationship details
-        group_members = {}
-        group_relationships = {}
+        group_members = defaultdict(list)
+        group_relationships = defaultdict(lambda: {'parallel': set(), 'crossing': set()})
 
         for runway_end, gid in groups.items():
-            if gid not in group_members:
-                group_members[gid] = []
-                group_relationships[gid] = {'parallel': set(), 'crossing': set()}
             group_members[gid].append(runway_end)
 
             # Track relationship types within group
@@ -12,6 +12,7 @@ from scenarios.base_scenario import BaseScenario
 from models.aircraft import Aircraft
 from models.spawn_delay_mode import SpawnDelayMode
 from utils.flight_data_filter import filter_valid_flights, clean_route_string
+from utils.json_utils import json_loads
 from utils.route_positioning import RouteParser
 from utils.artcc_utils import get_artcc_boundaries
 
@@ -61,13 +62,12 @@ class ArtccEnrouteScenario(BaseScenario):
 
     def _load_config(self) -> Dict:
         """Load config.json file"""
-        import json
         from pathlib import Path
 
         config_path = Path('config.json')
         if config_path.exists():
-            with open(config_path, 'r') as f:
-                return json.load(f)
+            with open(config_path, 'rb') as f:
+                return json_loads(f.read())
         return {}
 
     def generate(self,
@@ -247,23 +247,21 @@ class ArtccEnrouteScenario(BaseScenario):
         """
         all_flights = []
 
-        # Fetch from each departure airport individually (API only supports single airports)
-        for airport in departure_airports:
-            try:
-                logger.info(f"Fetching departures from {airport}")
-                flights = self.api_client.fetch_flights(
-                    departure=airport,
-                    limit=800
-                )
-
-                if flights:
-                    all_flights.extend(flights)
-                    logger.info(f"Fetched {len(flights)} departures from {airport}")
-                else:
-                    logger.warning(f"No departures fetched for {airport}")
+        # Fetch from each departure airport individually (API only supports single airports),
+        # with the per-airport requests running concurrently
+        logger.info(f"Fetching departures from {', '.join(departure_airports)}")
+        results = self.api_client.fetch_flights_bulk(
+            [{'departure': airport, 'limit': 800} for airport in departure_airports]
+        )
 
-            except Exception as e:
-                logger.error(f"Error fetching departures from {airport}: {e}")
+        for airport, flights in zip(departure_airports, results):
+            if flights:
+                all_flights.extend(flights)
+                logger.info(f"Fetched {len(flights)} departures from {airport}")
+            elif flights is None:
+                logger.error(f"Error fetching departures from {airport}")
+            else:
+                logger.warning(f"No departures fetched for {airport}")
 
         if not all_flights:
             logger.warning(f"No departures fetched for any airports")
@@ -287,23 +285,21 @@ class ArtccEnrouteScenario(BaseScenario):
         """
         all_flights = []
 
-        # Fetch from each arrival airport individually (API only supports single airports)
-        for airport in arrival_airports:
-            try:
-                logger.info(f"Fetching arrivals to {airport}")
-                flights = self.api_client.fetch_flights(
-                    arrival=airport,
-                    limit=800
-                )
-
-                if flights:
-                    all_flights.extend(flights)
-                    logger.info(f"Fetched {len(flights)} arrivals to {airport}")
-                else:
-                    logger.warning(f"No arrivals fetched for {airport}")
+        # Fetch from each arrival airport individually (API only supports single airports),
+        # with the per-airport requests running concurrently
+        logger.info(f"Fetching arrivals to {', '.join(arrival_airports)}")
+        results = self.api_client.fetch_flights_bulk(
+            [{'arrival': airport, 'limit': 800} for airport in arrival_airports]
+        )
 
-            except Exception as e:
-                logger.error(f"Error fetching arrivals to {airport}: {e}")
+        for airport, flights in zip(arrival_airports, results):
+            if flights:
+                all_flights.extend(flights)
+                logger.info(f"Fetched {len(flights)} arrivals to {airport}")
+            elif flights is None:
+                logger.error(f"Error fetching arrivals to {airport}")
+            else:
+                logger.warning(f"No arrivals fetched for {airport}")
 
         if not all_flights:
             logger.warning(f"No arrivals fetched for any airports")
@@ -946,8 +942,7 @@ class ArtccEnrouteScenario(BaseScenario):
         departure_3letter = departure[1:] if departure.startswith('K') else departure[-3:]
 
         # Get filed altitude from API - guaranteed to exist due to filtering
-        requested_alt = flight_data.get('requestedAltitude') or flight_data.get('assignedAltitude')
-        cruise_altitude = str(int(float(requested_alt)))
+        cruise_altitude = self._parse_requested_altitude(flight_data)
 
         # Get filed speed from API - guaranteed to exist due to filtering
         filed_speed = flight_data.get('requestedAirspeed')  # API uses 'requestedAirspeed' not 'cruiseSpeed'
@@ -2,10 +2,10 @@
 Base scenario class
 """
 import random
+import re
 import logging
-import json
 import threading
-from typing import List, Dict, Tuple
+from typing import List, Dict, Tuple, Optional
 from abc import ABC, abstractmethod
 from pathlib import Path
 from concurrent.futures import ThreadPoolExecutor, as_completed
@@ -15,10 +15,11 @@ from models.spawn_delay_mode import SpawnDelayMode
 from parsers.geojson_parser import GeoJSONParser
 from parsers.cifp_parser import CIFPParser
 from utils.api_client import FlightDataAPIClient
-from utils.constants import POPULAR_US_AIRPORTS, LESS_COMMON_AIRPORTS, COMMON_JETS, COMMON_GA_AIRCRAFT
+from utils.json_utils import json_loads
+from utils.constants import POPULAR_US_AIRPORTS, LESS_COMMON_AIRPORTS, COMMON_JETS, COMMON_GA_AIRCRAFT, COMMON_GA_AIRCRAFT_SET
 from utils.flight_data_filter import (
-    filter_valid_flights, categorize_flights, filter_by_parking_airline, is_ga_aircraft,
-    get_airline_from_callsign, clean_route_string
+    filter_valid_flights, filter_and_categorize_flights, filter_by_parking_airline, is_ga_aircraft,
+    get_airline_from_callsign, clean_route_string, extract_sid_from_route, strip_procedure_number
 )
 
 logger = logging.getLogger(__name__)
@@ -58,6 +59,7 @@ class BaseScenario(ABC):
         self.callsign_lock = threading.Lock()
         self.parking_lock = threading.Lock()
         self.aircraft_lock = threading.Lock()
+        self.flight_pool_lock = threading.Lock()
 
     @abstractmethod
     def generate(self, **kwargs) -> List[Aircraft]:
@@ -272,8 +274,8 @@ class BaseScenario(ABC):
         config_path = Path("config.json")
         if config_path.exists():
             try:
-                with open(config_path, 'r') as f:
-                    config = json.load(f)
+                with open(config_path, 'rb') as f:
+                    config = json_loads(f.read())
                     logger.info(f"Loaded configuration from {config_path}")
                     return config
             except Exception as e:
@@ -310,10 +312,8 @@ class BaseScenario(ABC):
         Returns:
             True if GA aircraft type, False if airline/commercial
         """
-        from utils.constants import COMMON_GA_AIRCRAFT
-
         base_type = aircraft_type.split('/')[0]
-        return base_type in COMMON_GA_AIRCRAFT
+        return base_type in COMMON_GA_AIRCRAFT_SET
 
     def _expand_gate_range(self, range_str: str) -> List[str]:
         """
@@ -330,8 +330,6 @@ class BaseScenario(ABC):
         Returns:
             List of expanded gate names
         """
-        import re
-
         match = re.match(r'^([A-Z]+)(\d+)-([A-Z]+)(\d+)$', range_str)
 
         if not match:
@@ -704,6 +702,10 @@ class BaseScenario(ABC):
         sids_found_in_data = {}  # Track SIDs found in flight data
         sids_matched = {}  # Track SIDs that matched our allowed list
 
+        # Allowed SIDs as sets, plus their base names (BROAK1 -> BROAK), so each flight's check is a lookup
+        allowed_sids = set(self.current_sids or [])
+        allowed_sid_bases = {strip_procedure_number(allowed_sid) for allowed_sid in allowed_sids}
+
         for flight in valid_flights:
             aircraft_type = flight.get('aircraftType', '')
             operator = flight.get('operator', 'UNKNOWN')
@@ -713,7 +715,6 @@ class BaseScenario(ABC):
             sid = flight.get('departureProcedure', '')
             if not sid and route:
                 # Extract SID from route (format: AIRPORT.SID.WAYPOINT...)
-                from utils.flight_data_filter import extract_sid_from_route
                 sid = extract_sid_from_route(route)
 
             # Separate GA flights into their own pool
@@ -736,21 +737,8 @@ class BaseScenario(ABC):
 
                 # Check if flight's SID matches our allowed list
                 # Support both exact match (BROAK1) and base match (BROAK matches BROAK1)
-                sid_matched = False
-
-                # Try exact match first
-                if sid in self.current_sids:
-                    sid_matched = True
-                else:
-                    # Try base name match (strip trailing digits from both)
-                    import re
-                    sid_base = re.sub(r'\d+$', '', sid)  # BROAK1 -> BROAK, or BROAK -> BROAK
-
-                    for allowed_sid in self.current_sids:
-                        allowed_base = re.sub(r'\d+$', '', allowed_sid)
-                        if sid_base == allowed_base:
-                            sid_matched = True
-                            break
+                sid_matched = (sid in allowed_sids or
+                               strip_procedure_number(sid) in allowed_sid_bases)  # BROAK1 -> BROAK
 
                 if not sid_matched:
                     # Check if SID exists in CIFP but doesn't match our runways
@@ -852,57 +840,80 @@ class BaseScenario(ABC):
         Returns:
             Flight dictionary or None if pool is empty
         """
-        # Handle GA spots - use GA pool directly
-        if is_ga_spot:
-            if self.ga_departure_flights:
-                return self.ga_departure_flights.pop(0)
-            logger.warning("GA departure pool depleted")
-            # Track failure reason
+        # Pools are shared between creation worker threads
+        with self.flight_pool_lock:
+            # Handle GA spots - use GA pool directly
+            if is_ga_spot:
+                if self.ga_departure_flights:
+                    return self.ga_departure_flights.pop(0)
+                logger.warning("GA departure pool depleted")
+                # Track failure reason
+                if parking_spot_name:
+                    self.gate_failure_reasons[parking_spot_name] = "GA pool depleted"
+                return None
+
+            # Get airline restrictions for this gate
             if parking_spot_name:
-                self.gate_failure_reasons[parking_spot_name] = "GA pool depleted"
-            return None
+                parking_airlines = self._get_airline_for_parking(parking_spot_name)
 
-        # Get airline restrictions for this gate
-        if parking_spot_name:
-            parking_airlines = self._get_airline_for_parking(parking_spot_name)
+                # If gate is marked as BLANK, skip it entirely
+                if parking_airlines == "BLANK":
+                    logger.debug(f"Skipping gate {parking_spot_name} - marked as BLANK (prohibited)")
+                    self.gate_failure_reasons[parking_spot_name] = "BLANK (prohibited)"
+                    return None
 
-            # If gate is marked as BLANK, skip it entirely
-            if parking_airlines == "BLANK":
-                logger.debug(f"Skipping gate {parking_spot_name} - marked as BLANK (prohibited)")
-                self.gate_failure_reasons[parking_spot_name] = "BLANK (prohibited)"
-                return None
+                if parking_airlines:
+                    # Convert single airline to list for uniform handling
+                    if isinstance(parking_airlines, str):
+                        parking_airlines = [parking_airlines]
+
+                    logger.debug(f"Gate {parking_spot_name} allows airlines {parking_airlines}")
+
+                    # Try each allowed airline in order
+                    for airline in parking_airlines:
+                        if airline in self.departure_flights_by_airline and self.departure_flights_by_airline[airline]:
+                            flight = self.departure_flights_by_airline[airline].pop(0)
+                            logger.debug(f"[MATCH] Assigned {flight.get('aircraftIdentification')} ({airline}) to gate {parking_spot_name}")
+                            return flight
+
+                    # No flights found for any allowed airline
+                    available_counts = {airline: len(self.departure_flights_by_airline.get(airline, [])) for airline in parking_airlines}
+                    logger.warning(f"[NO MATCH] Gate {parking_spot_name} allows {parking_airlines} but no flights available: {available_counts}")
+                    # Track failure reason with airline counts
+                    airlines_str = ', '.join([f"{a}={c}" for a, c in available_counts.items()])
+                    self.gate_failure_reasons[parking_spot_name] = f"No flights for allowed airlines ({airlines_str})"
+                    return None
 
-            if parking_airlines:
-                # Convert single airline to list for uniform handling
-                if isinstance(parking_airlines, str):
-                    parking_airlines = [parking_airlines]
-
-                logger.debug(f"Gate {parking_spot_name} allows airlines {parking_airlines}")
-
-                # Try each allowed airline in order
-                for airline in parking_airlines:
-                    if airline in self.departure_flights_by_airline and self.departure_flights_by_airline[airline]:
-                        flight = self.departure_flights_by_airline[airline].pop(0)
-                        logger.debug(f"[MATCH] Assigned {flight.get('aircraftIdentification')} ({airline}) to gate {parking_spot_name}")
-                        return flight
-
-                # No flights found for any allowed airline
-                available_counts = {airline: len(self.departure_flights_by_airline.get(airline, [])) for airline in parking_airlines}
-                logger.warning(f"[NO MATCH] Gate {parking_spot_name} allows {parking_airlines} but no flights available: {available_counts}")
-                # Track failure reason with airline counts
-                airlines_str = ', '.join([f"{a}={c}" for a, c in available_counts.items()])
-                self.gate_failure_reasons[parking_spot_name] = f"No flights for allowed airlines ({airlines_str})"
-                return None
+            # Fallback: no gate restriction, use any available airline flight
+            for airline, flights in self.departure_flights_by_airline.items():
+                if flights:
+                    flight = flights.pop(0)
+                    logger.debug(f"Assigned {flight.get('aircraftIdentification')} ({airline}) (no gate restriction)")
+                    return flight
 
-        # Fallback: no gate restriction, use any available airline flight
-        for airline, flights in self.departure_flights_by_airline.items():
-            if flights:
-                flight = flights.pop(0)
-                logger.debug(f"Assigned {flight.get('aircraftIdentification')} ({airline}) (no gate restriction)")
-                return flight
+            logger.warning("All departure flight pools depleted")
+            return None
 
-        logger.warning("All departure flight pools depleted")
-        return None
+    def _parse_requested_altitude(self, flight_data: Dict) -> Optional[str]:
+        """
+        Get the filed cruise altitude from API flight data as a string of feet
+
+        Args:
+            flight_data: Flight dictionary from API
+
+        Returns:
+            Altitude in feet (e.g., "35000"), or None if the flight has none
+        """
+        altitude = flight_data.get('requestedAltitude') or flight_data.get('assignedAltitude')
+        if not altitude:
+            return None
+
+        # The API normally sends a plain number; skip the float round-trip for it
+        if type(altitude) is int:
+            return str(altitude)
+        if isinstance(altitude, str) and altitude[:2] == 'FL':
+            return str(int(altitude[2:]) * 100)
+        return str(int(float(altitude)))
 
     def _create_departure_aircraft(self, parking_spot, destination: str = None,
                                    callsign: str = None, aircraft_type: str = None,
@@ -933,11 +944,7 @@ class BaseScenario(ABC):
         api_callsign = flight_data.get('aircraftIdentification', '')
         api_aircraft_type = flight_data.get('aircraftType', 'B738')
 
-        requested_alt = flight_data.get('requestedAltitude') or flight_data.get('assignedAltitude')
-        if requested_alt:
-            cruise_altitude = str(int(float(requested_alt)))
-        else:
-            cruise_altitude = '35000'
+        cruise_altitude = self._parse_requested_altitude(flight_data) or '35000'
 
         cruise_speed_str = flight_data.get('requestedAirspeed')
         if cruise_speed_str:
@@ -1010,8 +1017,7 @@ class BaseScenario(ABC):
         """
         if not hasattr(self, 'ga_departure_flights'):
             logger.warning("GA departure flights not initialized, initializing now...")
-            valid_flights = filter_valid_flights(self.cached_flights['departures'])
-            ga_flights, _ = categorize_flights(valid_flights)
+            ga_flights, _ = filter_and_categorize_flights(self.cached_flights['departures'])
             self.ga_departure_flights = ga_flights
             logger.info(f"Prepared GA flight pool with {len(ga_flights)} aircraft")
 
@@ -1023,18 +1029,18 @@ class BaseScenario(ABC):
         if not hasattr(self, 'ga_departure_flights'):
             self._prepare_ga_flight_pool()
 
-        if not self.ga_departure_flights:
-            logger.warning("GA flight pool depleted")
-            return None
+        with self.flight_pool_lock:
+            if not self.ga_departure_flights:
+                logger.warning("GA flight pool depleted")
+                return None
 
-        # GA flights are already filtered, just return the next one
-        return self.ga_departure_flights.pop(0)
+            # GA flights are already filtered, just return the next one
+            return self.ga_departure_flights.pop(0)
 
     def _prepare_arrival_flight_pool(self):
         """Prepare pool of arrival flights from cached arrival data"""
-        valid_flights = filter_valid_flights(self.cached_flights['arrivals'])
         # For arrivals, we want commercial flights (non-GA)
-        _, commercial_flights = categorize_flights(valid_flights)
+        _, commercial_flights = filter_and_categorize_flights(self.cached_flights['arrivals'])
 
         self.arrival_flight_pool = commercial_flights
         logger.info(f"Prepared arrival flight pool with {len(commercial_flights)} aircraft")
@@ -1048,8 +1054,7 @@ class BaseScenario(ABC):
             logger.warning("Arrival flight pool depleted, fetching more...")
             additional_flights = self.api_client.fetch_arrivals(self.airport_icao, limit=50)
             if additional_flights:
-                valid_flights = filter_valid_flights(additional_flights)
-                _, commercial_flights = categorize_flights(valid_flights)
+                _, commercial_flights = filter_and_categorize_flights(additional_flights)
                 self.arrival_flight_pool.extend(commercial_flights)
                 logger.info(f"Added {len(commercial_flights)} more arrival flights to pool")
 
@@ -1057,11 +1062,12 @@ class BaseScenario(ABC):
 
     def _create_ga_aircraft(self, parking_spot, destination: str = None) -> Aircraft:
         """Create a GA (general aviation) aircraft using API data"""
-        if parking_spot.name in self.used_parking_spots:
-            logger.warning(f"Parking spot {parking_spot.name} is already in use, skipping")
-            return None
+        with self.parking_lock:
+            if parking_spot.name in self.used_parking_spots:
+                logger.warning(f"Parking spot {parking_spot.name} is already in use, skipping")
+                return None
+            self.used_parking_spots.add(parking_spot.name)
 
-        self.used_parking_spots.add(parking_spot.name)
         logger.debug(f"Assigned parking spot: {parking_spot.name}")
 
         flight_data = self._get_next_ga_flight()
@@ -1079,11 +1085,7 @@ class BaseScenario(ABC):
             raw_route = flight_data.get('route', 'DCT')
             route = clean_route_string(raw_route) if raw_route != 'DCT' else 'DCT'
 
-            requested_alt = flight_data.get('requestedAltitude') or flight_data.get('assignedAltitude')
-            if requested_alt:
-                cruise_altitude = str(int(float(requested_alt)))
-            else:
-                cruise_altitude = str(random.randint(3000, 8000))
+            cruise_altitude = self._parse_requested_altitude(flight_data) or str(random.randint(3000, 8000))
 
             cruise_speed_str = flight_data.get('requestedAirspeed')
             if cruise_speed_str:
@@ -1120,7 +1122,8 @@ class BaseScenario(ABC):
                 # If from API data, skip this flight to maintain data integrity
                 if flight_data and flight_data.get('aircraftIdentification'):
                     logger.warning(f"Duplicate GA callsign from API: {callsign}, skipping this flight")
-                    self.used_parking_spots.discard(parking_spot.name)
+                    with self.parking_lock:
+                        self.used_parking_spots.discard(parking_spot.name)
                     return None
                 # Otherwise generate new callsign (only for fallback generated aircraft)
                 while callsign in self.used_callsigns:
@@ -10,6 +10,7 @@ from scenarios.base_scenario import BaseScenario
 from models.aircraft import Aircraft
 from models.spawn_delay_mode import SpawnDelayMode
 from utils.flight_data_filter import clean_route_string
+from utils.constants import COMMON_GA_AIRCRAFT_SET
 
 logger = logging.getLogger(__name__)
 
@@ -270,11 +271,7 @@ class GroundMixedScenario(BaseScenario):
         api_aircraft_type = flight_data.get('aircraftType', 'B738')
 
         # Calculate cruise altitude from requested altitude or default
-        requested_alt = flight_data.get('requestedAltitude') or flight_data.get('assignedAltitude')
-        if requested_alt:
-            cruise_altitude = str(int(float(requested_alt)))
-        else:
-            cruise_altitude = '35000'
+        cruise_altitude = self._parse_requested_altitude(flight_data) or '35000'
 
         # Calculate cruise speed
         cruise_speed_str = flight_data.get('requestedAirspeed')
@@ -354,13 +351,11 @@ class GroundMixedScenario(BaseScenario):
         Returns:
             Ground speed in knots appropriate for final approach
         """
-        from utils.constants import COMMON_GA_AIRCRAFT
-
         # Extract base aircraft type (remove suffix like /L)
         base_type = aircraft_type.split('/')[0]
 
         # GA aircraft fly slower approach speeds (70-90 knots)
-        if base_type in COMMON_GA_AIRCRAFT:
+        if base_type in COMMON_GA_AIRCRAFT_SET:
             return random.randint(70, 90)
 
         # Heavy jets (B744, B77W, B788, etc.) fly faster approaches (145-160 knots)
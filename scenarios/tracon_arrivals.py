@@ -205,17 +205,14 @@ class TraconArrivalsScenario(BaseScenario):
         return re.sub(r'\d+$', '', procedure)
 
     def _deduplicate_by_gufi(self, flights: List[Dict]) -> List[Dict]:
-        """Remove duplicate flights by GUFI"""
-        seen = set()
-        unique = []
+        """Remove duplicate flights by GUFI (flights without a GUFI are always kept)"""
+        # Insertion-ordered dict keeps the first flight per GUFI in original order
+        unique = {}
         for flight in flights:
-            gufi = flight.get('gufi', '')
-            if gufi and gufi not in seen:
-                seen.add(gufi)
-                unique.append(flight)
-            elif not gufi:
-                unique.append(flight)  # Keep flights without GUFI
-        return unique
+            key = flight.get('gufi') or id(flight)
+            if key not in unique:
+                unique[key] = flight
+        return list(unique.values())
 
     def _group_flights_by_star(self, flights: List[Dict]) -> Dict[str, List[Dict]]:
         """Group flights by their arrivalProcedure field"""
@@ -223,7 +220,8 @@ class TraconArrivalsScenario(BaseScenario):
         for flight in flights:
             star = flight.get('arrivalProcedure', 'UNKNOWN').upper()
             groups[star].append(flight)
-        return dict(groups)
+        # Callers only use .get()/membership, so the defaultdict is returned as-is
+        return groups
 
     def _create_arrival_aircraft(self, flight_data: Dict, waypoint, star_name: str,
                                   active_runways: List[str] = None) -> Aircraft:
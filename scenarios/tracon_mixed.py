@@ -2,23 +2,103 @@
 TRACON (Departures/Arrivals) scenario
 """
 import re
+import math
 import random
 import logging
-from typing import List, Tuple, Dict, Optional
+import threading
+from typing import List, Tuple, Dict, Iterator, Optional
 from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 
 from scenarios.base_scenario import BaseScenario
 from models.aircraft import Aircraft
 from models.spawn_delay_mode import SpawnDelayMode
 from utils.geo_utils import calculate_bearing, calculate_destination, get_reciprocal_heading
-from utils.flight_data_filter import filter_valid_flights, clean_route_string
+from utils.flight_data_filter import is_valid_flight, filter_valid_flights, clean_route_string
 
 logger = logging.getLogger(__name__)
 
 
+@lru_cache(maxsize=64)
+def _normalize_runway(runway: str) -> Tuple[str, str]:
+    """
+    Normalize a runway designator for comparison.
+
+    Strips any "RW" prefix and pads single-digit runways with a leading zero.
+
+    Args:
+        runway: Runway designator or CIFP transition name (e.g., "8L", "08L", "RW08")
+
+    Returns:
+        Tuple of (normalized, base) - e.g., "8L" -> ("08L", "08")
+    """
+    normalized = runway.replace('RW', '')
+    if normalized and normalized[0].isdigit():
+        if len(normalized) == 1 or (len(normalized) == 2 and not normalized[1].isdigit()):
+            # Single digit runway (8 or 8L) - pad with zero
+            normalized = '0' + normalized
+    return normalized, normalized.rstrip('LRC')
+
+
+@lru_cache(maxsize=256)
+def _arrival_speed(altitude: int, is_ga: bool) -> int:
+    """
+    Altitude-based arrival speed, memoized since altitudes and GA/jet splits repeat heavily.
+
+    Uses an exponential relationship where speed increases with altitude.
+
+    Args:
+        altitude: Altitude in feet MSL
+        is_ga: True for general aviation aircraft
+
+    Returns:
+        Speed in knots, rounded to the nearest 5
+    """
+    if is_ga:
+        # General aviation speeds are lower
+        # Base: 110 kts, increases to ~170 kts at high altitude
+        base_speed = 110
+        max_speed = 170
+    else:
+        # Jet/turboprop speeds
+        # Base: 140 kts (approach speed), max: 330 kts (yields ~310 kts at 18,000 ft)
+        base_speed = 140
+        max_speed = 330
+
+    # Exponential formula: speed = base + (max - base) * (1 - e^(-altitude / scale))
+    # Scale factor controls how quickly speed increases with altitude
+    scale_factor = 8000  # Altitude in feet where speed reaches ~63% of max
+
+    speed_ratio = 1 - math.exp(-altitude / scale_factor)
+    calculated_speed = base_speed + (max_speed - base_speed) * speed_ratio
+
+    # Round to nearest 5 knots for realism
+    return int(round(calculated_speed / 5) * 5)
+
+
 class TraconMixedScenario(BaseScenario):
     """Scenario for TRACON with both departures and arrivals"""
 
+    def __init__(self, airport_icao: str, geojson_parser, cifp_parser, api_client,
+                 cached_flights: Dict[str, List] = None):
+        """Initialize the scenario and its per-run CIFP lookup caches (see BaseScenario)"""
+        super().__init__(airport_icao, geojson_parser, cifp_parser, api_client, cached_flights)
+
+        # Filled lazily by the arrival worker threads - writes go through cifp_cache_lock
+        self.cifp_cache_lock = threading.Lock()
+        self._seq_index_cache: Dict[str, Dict[int, List[Tuple[str, object]]]] = {}
+        self._runway_sel_cache: Dict[Tuple[Tuple[str, ...], str], str] = {}
+        self._frd_cache: Dict[Tuple[str, str, str], str] = {}
+
+    def _reset_tracking(self):
+        """Reset tracking sets and per-run CIFP lookup caches for a new generation"""
+        super()._reset_tracking()
+        with self.cifp_cache_lock:
+            self._seq_index_cache.clear()
+            self._runway_sel_cache.clear()
+            self._frd_cache.clear()
+
     def generate(self, num_departures: int, num_arrivals: int, arrival_waypoints: List[str],
                  delay_range: Tuple[int, int] = (4, 7),
                  spawn_delay_mode: SpawnDelayMode = SpawnDelayMode.NONE,
@@ -57,6 +137,9 @@ class TraconMixedScenario(BaseScenario):
         # Reset tracking for new generation
         self._reset_tracking()
 
+        # Local generator bound once for the generation loops below
+        rng = random.Random()
+
         # Handle backward compatibility - if old difficulty_config is provided but not separate configs
         if difficulty_config and not difficulty_departures_config and not difficulty_arrivals_config:
             difficulty_departures_config = difficulty_config
@@ -76,24 +159,16 @@ class TraconMixedScenario(BaseScenario):
         # Fetch and prepare arrival flights using new simplified approach
         flights_by_star = {}
         if star_transitions:
-            star_names = list(set([self._strip_numbers(star) for _, star in star_transitions if star]))
-            logger.info(f"Fetching flights for STARs: {star_names}")
+            star_names = list(set([star_base for _, _, star_base in star_transitions if star_base]))
+            logger.info("Fetching flights for STARs: %s", star_names)
 
             # Single API call to get ALL arrival flights
             all_flights = self.api_client.fetch_arrivals(self.airport_icao, limit=619, stars=star_names)
             if all_flights:
-                # Filter valid flights (removes ACTIVE status, missing data, etc.)
-                valid_flights = filter_valid_flights(all_flights)
-                logger.info(f"Got {len(valid_flights)} valid arrival flights from API")
-
-                # Deduplicate by GUFI
-                unique_flights = self._deduplicate_by_gufi(valid_flights)
-                logger.info(f"After deduplication: {len(unique_flights)} unique arrival flights")
-
-                # Group by STAR
-                flights_by_star = self._group_flights_by_star(unique_flights)
+                # Filter valid flights, deduplicate by GUFI and group by STAR in one pass
+                flights_by_star = self._process_arrival_flights(all_flights)
                 for star, flights in flights_by_star.items():
-                    logger.info(f"  {star}: {len(flights)} flights")
+                    logger.info("  %s: %d flights", star, len(flights))
             else:
                 logger.warning("Failed to fetch arrival flights from API")
         else:
@@ -109,6 +184,8 @@ class TraconMixedScenario(BaseScenario):
             min_delay, max_delay = self._parse_spawn_delay_range(spawn_delay_range)
 
         parking_spots = self.geojson_parser.get_parking_spots()
+        # GA spots have "GA" in the name - evaluate once per spot rather than per attempt
+        spot_is_ga = {spot.name: "GA" in spot.name.upper() for spot in parking_spots}
 
         if num_departures > len(parking_spots):
             raise ValueError(
@@ -116,146 +193,127 @@ class TraconMixedScenario(BaseScenario):
                 f"Please reduce the number of departures to {len(parking_spots)} or fewer."
             )
 
-        logger.info(f"Generating TRACON mixed scenario: {num_departures} departures, {num_arrivals} arrivals")
+        logger.info("Generating TRACON mixed scenario: %s departures, %s arrivals", num_departures, num_arrivals)
 
         # Generate departures into a separate list for later merging
+        # Aircraft are created in parallel batches; workers only build aircraft, and the
+        # stateful post-processing (retries, spawn delays, difficulty) runs on the main
+        # thread in the order the spots were picked, so it doesn't depend on worker timing
         departures_list = []
         failed_gates = []
         attempts = 0
         max_attempts = len(parking_spots) * 2
         available_spots = parking_spots.copy()
-
-        while len(departures_list) < num_departures and attempts < max_attempts and available_spots:
-            spot = random.choice(available_spots)
-
-            # Check if parking spot is for GA (has "GA" in the name)
-            if "GA" in spot.name.upper():
-                logger.info(f"Creating GA aircraft for parking spot: {spot.name}")
-                aircraft = self._create_ga_aircraft(spot)
-            else:
-                aircraft = self._create_departure_aircraft(
-                    spot,
-                    active_runways=active_runways,
-                    enable_cifp_sids=enable_cifp_sids,
-                    manual_sids=manual_sids
-                )
-
-            if aircraft is not None:
-                # Only remove spot if aircraft was successfully created
-                available_spots.remove(spot)
-                # Legacy mode: apply random spawn delay
-                if spawn_delay_range and not delay_value:
-                    aircraft.spawn_delay = random.randint(min_delay, max_delay)
-                    logger.info(f"Set spawn_delay={aircraft.spawn_delay}s for {aircraft.callsign} (legacy mode)")
-                difficulty_departures_index = self._assign_difficulty(aircraft, difficulty_departures_list, difficulty_departures_index)
-                departures_list.append(aircraft)
-            else:
-                # Track which gate failed to create aircraft
-                if spot.name not in failed_gates:
-                    failed_gates.append(spot.name)
-
-            attempts += 1
+        rng.shuffle(available_spots)
+        created_departures = []  # (pick order, aircraft)
+
+        if num_departures > 0:
+            with ThreadPoolExecutor(max_workers=min(8, num_departures)) as executor:
+                while len(created_departures) < num_departures and attempts < max_attempts and available_spots:
+                    batch_size = min(num_departures - len(created_departures), max_attempts - attempts)
+                    chosen_spots = available_spots[-batch_size:]
+                    del available_spots[-batch_size:]
+
+                    futures = [
+                        executor.submit(self._create_departure_for_spot, spot, spot_is_ga[spot.name],
+                                        active_runways, enable_cifp_sids, manual_sids)
+                        for spot in chosen_spots
+                    ]
+                    retry_spots = []
+                    for offset, (spot, future) in enumerate(zip(chosen_spots, futures)):
+                        aircraft = future.result()
+                        if aircraft is not None:
+                            created_departures.append((attempts + offset, aircraft))
+                        else:
+                            # Track which gate failed to create aircraft; it stays available for a retry
+                            if spot.name not in failed_gates:
+                                failed_gates.append(spot.name)
+                            retry_spots.append(spot)
+
+                    attempts += len(chosen_spots)
+                    # Put failed spots back at random positions so retries stay randomized
+                    for spot in retry_spots:
+                        available_spots.insert(rng.randint(0, len(available_spots)), spot)
+
+        created_departures.sort(key=lambda item: item[0])
+        for _, aircraft in created_departures:
+            # Legacy mode: apply random spawn delay
+            if spawn_delay_range and not delay_value:
+                aircraft.spawn_delay = rng.randint(min_delay, max_delay)
+                logger.info("Set spawn_delay=%ss for %s (legacy mode)", aircraft.spawn_delay, aircraft.callsign)
+            difficulty_departures_index = self._assign_difficulty(aircraft, difficulty_departures_list, difficulty_departures_index)
+            departures_list.append(aircraft)
 
         # Generate arrivals into a separate list for later merging
         arrivals_list = []
         if not star_transitions:
             logger.warning("No valid STAR waypoints provided for arrivals")
         else:
-            # Track which flight index we're using for each STAR
-            star_flight_indices = defaultdict(int)
-
+            # Resolve each transition's waypoint once up front; invalid entries are reported
+            # here and dropped so the round-robin never lands on them
+            transition_waypoints = {}
+            valid_transitions = []
+            for waypoint_name, star_name, star_base in star_transitions:
+                key = (waypoint_name, star_name)
+                if key not in transition_waypoints:
+                    waypoint = self.cifp_parser.get_transition_waypoint(waypoint_name, star_name)
+                    error_msg = None
+                    if not waypoint:
+                        error_msg = f"Waypoint {waypoint_name}.{star_name} not found in CIFP data"
+                    elif waypoint.latitude == 0.0 and waypoint.longitude == 0.0:
+                        # Waypoint exists but has no valid coordinates
+                        error_msg = f"Waypoint {waypoint.name} has no coordinate data"
+                    if error_msg:
+                        logger.warning(error_msg)
+                        if error_msg not in self.cifp_waypoint_errors:
+                            self.cifp_waypoint_errors.append(error_msg)
+                        waypoint = None
+                    transition_waypoints[key] = waypoint
+                if transition_waypoints[key] is not None:
+                    valid_transitions.append((transition_waypoints[key], star_name, star_base))
+
+            # Iterator over the unused flights for each STAR
+            star_iters = {star: iter(flights) for star, flights in flights_by_star.items()}
+            refetched_stars = set()  # STARs already topped up from the API this run
+
+            # Plan every (waypoint, flight, STAR) job up front in STAR round-robin order, reserving
+            # callsigns as we go, so the sequence doesn't depend on worker timing
+            jobs = self._plan_arrival_jobs(valid_transitions, flights_by_star, star_iters,
+                                           refetched_stars, num_arrivals) if valid_transitions else []
+
+            # Create aircraft in parallel, then post-process in submission order
+            # so the arrivals keep their STAR round-robin sequence
             arrivals_created = 0
-            attempts = 0
-            max_attempts = num_arrivals * 10  # Allow 10x attempts to handle missing data/waypoints
-            star_round_robin_index = 0  # Track round-robin position (only advances on successful creation)
-
-            while arrivals_created < num_arrivals and attempts < max_attempts:
-                waypoint_name, star_name = star_transitions[star_round_robin_index % len(star_transitions)]
-
-                # Get waypoint for this STAR
-                waypoint = self.cifp_parser.get_transition_waypoint(waypoint_name, star_name)
-
-                if not waypoint:
-                    error_msg = f"Waypoint {waypoint_name}.{star_name} not found in CIFP data"
-                    logger.warning(error_msg)
-                    if error_msg not in self.cifp_waypoint_errors:
-                        self.cifp_waypoint_errors.append(error_msg)
-                    attempts += 1
-                    continue
-
-                # Check if waypoint has valid coordinates
-                if waypoint.latitude == 0.0 and waypoint.longitude == 0.0:
-                    error_msg = f"Waypoint {waypoint.name} has no coordinate data"
-                    logger.warning(error_msg)
-                    if error_msg not in self.cifp_waypoint_errors:
-                        self.cifp_waypoint_errors.append(error_msg)
-                    attempts += 1
-                    continue
-
-                # Get flights for this STAR
-                star_base = self._strip_numbers(star_name).upper() if star_name else None
-                available_flights = flights_by_star.get(star_base, []) if star_base else []
-
-                if not available_flights:
-                    logger.warning(f"No flights available for STAR {star_base}")
-                    attempts += 1
-                    continue
-
-                # Get next unused flight for this STAR
-                flight_index = star_flight_indices[star_base]
-                if flight_index >= len(available_flights):
-                    # Try to fetch more flights from API
-                    logger.info(f"Flight pool exhausted for STAR {star_base}, fetching more from API...")
-                    additional_flights = self.api_client.fetch_arrivals(self.airport_icao, limit=100, stars=[star_base])
-                    if additional_flights:
-                        valid_flights = filter_valid_flights(additional_flights)
-                        unique_flights = self._deduplicate_by_gufi(valid_flights)
-                        if unique_flights:
-                            # Add to the flight pool for this STAR
-                            if star_base not in flights_by_star:
-                                flights_by_star[star_base] = []
-                            flights_by_star[star_base].extend(unique_flights)
-                            available_flights = flights_by_star[star_base]
-                            logger.info(f"Added {len(unique_flights)} more flights for STAR {star_base}")
-                        else:
-                            logger.warning(f"No additional valid flights found for STAR {star_base}")
-                            attempts += 1
-                            continue
-                    else:
-                        logger.warning(f"Failed to fetch additional flights for STAR {star_base}")
-                        attempts += 1
-                        continue
-
-                flight_data = available_flights[flight_index]
-                star_flight_indices[star_base] += 1
-
-                # Create aircraft from flight data
-                aircraft = self._create_arrival_at_waypoint(waypoint, flight_data, star_name, active_runways)
-                if aircraft is not None:
-                    # Legacy mode: apply random spawn delay
-                    if spawn_delay_range and not delay_value:
-                        aircraft.spawn_delay = random.randint(min_delay, max_delay)
-                        logger.info(f"Set spawn_delay={aircraft.spawn_delay}s for {aircraft.callsign} (legacy mode)")
-                    difficulty_arrivals_index = self._assign_difficulty(aircraft, difficulty_arrivals_list, difficulty_arrivals_index)
-                    arrivals_list.append(aircraft)
-                    arrivals_created += 1
-                    star_round_robin_index += 1  # Advance round-robin only on successful creation
-
-                attempts += 1
+            if jobs:
+                with ThreadPoolExecutor(max_workers=min(8, len(jobs))) as executor:
+                    futures = [
+                        executor.submit(self._create_arrival_at_waypoint, waypoint, flight_data, star_name, active_runways)
+                        for waypoint, flight_data, star_name in jobs
+                    ]
+                    for future in futures:
+                        aircraft = future.result()
+                        # Legacy mode: apply random spawn delay
+                        if spawn_delay_range and not delay_value:
+                            aircraft.spawn_delay = rng.randint(min_delay, max_delay)
+                            logger.info("Set spawn_delay=%ss for %s (legacy mode)", aircraft.spawn_delay, aircraft.callsign)
+                        difficulty_arrivals_index = self._assign_difficulty(aircraft, difficulty_arrivals_list, difficulty_arrivals_index)
+                        arrivals_list.append(aircraft)
+                        arrivals_created += 1
 
             if arrivals_created < num_arrivals:
-                logger.warning(f"Could only generate {arrivals_created}/{num_arrivals} arrivals after {attempts} attempts (limited API data or missing waypoints)")
+                logger.warning("Could only generate %d/%s arrivals (limited API data or missing waypoints)", arrivals_created, num_arrivals)
 
         # Generate VFR aircraft into a separate list for later merging
         vfr_list = []
         if num_vfr > 0:
-            logger.info(f"Generating {num_vfr} VFR aircraft")
+            logger.info("Generating %s VFR aircraft", num_vfr)
             vfr_list = self._generate_vfr_aircraft(num_vfr, vfr_spawn_locations, active_runways, difficulty_arrivals_list, difficulty_arrivals_index)
 
         # Merge all aircraft lists: randomly interleave departures and VFR into arrivals
         # while preserving the arrivals' STAR alternating order
-        self.aircraft = self._merge_aircraft_randomly(arrivals_list, departures_list, vfr_list)
-        logger.info(f"Merged {len(departures_list)} departures, {len(arrivals_list)} arrivals, and {len(vfr_list)} VFR into randomized sequence")
+        self.aircraft = self._merge_aircraft_randomly(arrivals_list, departures_list, vfr_list, rng)
+        logger.info("Merged %d departures, %d arrivals, and %d VFR into randomized sequence",
+                    len(departures_list), len(arrivals_list), len(vfr_list))
 
         # Apply new spawn delay system
         if not spawn_delay_range:
@@ -266,10 +324,12 @@ class TraconMixedScenario(BaseScenario):
         num_arrivals_actual = sum(1 for a in self.aircraft if a.arrival == self.airport_icao and a.flight_rules == 'I')
         num_vfr_actual = sum(1 for a in self.aircraft if a.flight_rules == 'V')
 
-        logger.info(f"Generated {len(self.aircraft)} total aircraft: "
-                   f"{num_departures_actual} departures (requested {num_departures}), "
-                   f"{num_arrivals_actual} arrivals (requested {num_arrivals}), "
-                   f"{num_vfr_actual} VFR (requested {num_vfr})")
+        logger.info("Generated %d total aircraft: "
+                    "%d departures (requested %s), "
+                    "%d arrivals (requested %s), "
+                    "%d VFR (requested %s)",
+                    len(self.aircraft), num_departures_actual, num_departures,
+                    num_arrivals_actual, num_arrivals, num_vfr_actual, num_vfr)
 
         # Only add warning if we couldn't generate the requested number of departures
         if num_departures_actual < num_departures:
@@ -279,7 +339,7 @@ class TraconMixedScenario(BaseScenario):
             # Show detailed failure reasons for failed gates
             if failed_gates and shortage <= len(failed_gates):
                 logger.warning(warning_msg)
-                logger.warning(f"Gate assignment failures ({len(failed_gates)} gates):")
+                logger.warning("Gate assignment failures (%d gates):", len(failed_gates))
                 # Group gates by failure reason
                 failures_by_reason = defaultdict(list)
                 for gate in failed_gates:
@@ -291,7 +351,7 @@ class TraconMixedScenario(BaseScenario):
                     gate_list = ', '.join(gates[:10])
                     if len(gates) > 10:
                         gate_list += f" (and {len(gates) - 10} more)"
-                    logger.warning(f"  {reason}: {gate_list}")
+                    logger.warning("  %s: %s", reason, gate_list)
 
             else:
                 logger.warning(warning_msg)
@@ -300,8 +360,141 @@ class TraconMixedScenario(BaseScenario):
 
         return self.aircraft
 
+    def _create_departure_for_spot(self, spot, is_ga_spot: bool, active_runways: List[str] = None,
+                                   enable_cifp_sids: bool = False,
+                                   manual_sids: List[str] = None) -> Optional[Aircraft]:
+        """
+        Create a departure aircraft for a parking spot (GA or airline).
+
+        Safe to call from worker threads: parking, callsign and flight pool access are locked.
+
+        Args:
+            spot: Parking spot object
+            is_ga_spot: True if this is a GA parking spot (has "GA" in the name)
+            active_runways: List of active runway designators
+            enable_cifp_sids: Whether to use CIFP SID procedures
+            manual_sids: Optional list of specific SIDs to use
+
+        Returns:
+            Aircraft object or None if creation failed
+        """
+        if is_ga_spot:
+            logger.info("Creating GA aircraft for parking spot: %s", spot.name)
+            return self._create_ga_aircraft(spot)
+
+        return self._create_departure_aircraft(
+            spot,
+            active_runways=active_runways,
+            enable_cifp_sids=enable_cifp_sids,
+            manual_sids=manual_sids
+        )
+
+    def _plan_arrival_jobs(self, transitions: List[Tuple[object, str, str]], flights_by_star: Dict[str, List[Dict]],
+                           star_iters: Dict[str, Iterator[Dict]], refetched_stars: set,
+                           count: int) -> List[Tuple[object, Dict, str]]:
+        """
+        Allocate unused flights to STAR transitions in round-robin order.
+
+        Each planned flight's callsign is reserved here, so every job creates an aircraft. The
+        round-robin only moves on after a job is planned; a duplicate callsign retries the same
+        transition with its next flight. Transitions whose STAR has no flights left are skipped.
+        Stops once count jobs are planned or a full pass over the transitions yields no flight.
+
+        Args:
+            transitions: List of (waypoint, star_name, star_base) tuples with resolved, valid waypoints
+            flights_by_star: Flights grouped by STAR base name (topped up from the API when exhausted)
+            star_iters: Iterator over the unused flights per STAR base name (updated in place)
+            refetched_stars: STAR base names already topped up from the API (updated in place)
+            count: Maximum number of jobs to plan
+
+        Returns:
+            List of (waypoint, flight_data, star_name) jobs
+        """
+        jobs = []
+        star_round_robin_index = 0
+        idle = 0  # Consecutive transitions that produced no flight
+        while len(jobs) < count and idle < len(transitions):
+            waypoint, star_name, star_base = transitions[star_round_robin_index % len(transitions)]
+
+            flight_data = self._next_star_flight(star_base, flights_by_star, star_iters, refetched_stars)
+            if flight_data is None:
+                # Nothing left for this STAR - move on so the rotation can't stall on it
+                idle += 1
+                star_round_robin_index += 1
+                continue
+            idle = 0
+
+            # Check callsign uniqueness
+            callsign = flight_data.get('aircraftIdentification', '')
+            with self.callsign_lock:
+                duplicate = callsign in self.used_callsigns
+                if not duplicate:
+                    self.used_callsigns.add(callsign)
+            if duplicate:
+                logger.warning("Duplicate callsign %s, skipping", callsign)
+                continue
+
+            jobs.append((waypoint, flight_data, star_name))
+            star_round_robin_index += 1  # Advance round-robin only once the transition has an arrival
+
+        return jobs
+
+    def _next_star_flight(self, star_base: str, flights_by_star: Dict[str, List[Dict]],
+                          star_iters: Dict[str, Iterator[Dict]], refetched_stars: set) -> Optional[Dict]:
+        """
+        Get the next unused flight for a STAR, fetching more from the API once if the pool runs out.
+
+        Args:
+            star_base: STAR base name, uppercased without numbers (e.g., "EAGUL")
+            flights_by_star: Flights grouped by STAR base name
+            star_iters: Iterator over the unused flights per STAR base name (updated in place)
+            refetched_stars: STAR base names already topped up from the API
+
+        Returns:
+            Flight dictionary, or None if no flights are left for this STAR
+        """
+        # Get next unused flight for this STAR
+        flight_iter = star_iters.get(star_base)
+        if flight_iter is None:
+            logger.warning("No flights available for STAR %s", star_base)
+            return None
+
+        flight_data = next(flight_iter, None)
+        if flight_data is not None:
+            return flight_data
+
+        if star_base in refetched_stars:
+            return None
+        refetched_stars.add(star_base)
+
+        # Try to fetch more flights from API
+        logger.info("Flight pool exhausted for STAR %s, fetching more from API...", star_base)
+        additional_flights = self.api_client.fetch_arrivals(self.airport_icao, limit=100, stars=[star_base])
+        if not additional_flights:
+            logger.warning("Failed to fetch additional flights for STAR %s", star_base)
+            return None
+
+        # Skip flights already in the pool so a refetch can't replay used flights
+        available_flights = flights_by_star[star_base]
+        known_gufis = {flight.get('gufi') for flight in available_flights if flight.get('gufi')}
+        unique_flights = [
+            flight for flight in self._deduplicate_by_gufi(filter_valid_flights(additional_flights))
+            if flight.get('gufi') not in known_gufis
+        ]
+        if not unique_flights:
+            logger.warning("No additional valid flights found for STAR %s", star_base)
+            return None
+
+        # Add to the flight pool for this STAR; an exhausted list iterator can't resume,
+        # so continue from a fresh iterator over the new flights
+        available_flights.extend(unique_flights)
+        logger.info("Added %d more flights for STAR %s", len(unique_flights), star_base)
+        flight_iter = iter(unique_flights)
+        star_iters[star_base] = flight_iter
+        return next(flight_iter)
+
     def _merge_aircraft_randomly(self, arrivals: List[Aircraft], departures: List[Aircraft],
-                                  vfr: List[Aircraft]) -> List[Aircraft]:
+                                  vfr: List[Aircraft], rng: Optional[random.Random] = None) -> List[Aircraft]:
         """
         Merge departures and VFR aircraft randomly into arrivals list while preserving arrival order.
 
@@ -312,16 +505,19 @@ class TraconMixedScenario(BaseScenario):
             arrivals: List of arrival aircraft (in STAR alternating order)
             departures: List of departure aircraft
             vfr: List of VFR aircraft
+            rng: Optional random generator (defaults to the module-level random)
 
         Returns:
             Merged list with randomized order between aircraft types
         """
+        rng = rng or random
+
         # Combine departures and VFR into a single list to interleave
         non_arrivals = departures + vfr
 
         # If no arrivals, just return the non-arrivals list (shuffled for randomness)
         if not arrivals:
-            random.shuffle(non_arrivals)
+            rng.shuffle(non_arrivals)
             return non_arrivals
 
         # If no non-arrivals, just return the arrivals list in order
@@ -335,7 +531,7 @@ class TraconMixedScenario(BaseScenario):
         # This preserves the relative order of arrivals while mixing in departures/VFR
         for aircraft in non_arrivals:
             # Choose a random position to insert
-            insert_pos = random.randint(0, len(result))
+            insert_pos = rng.randint(0, len(result))
             result.insert(insert_pos, aircraft)
 
         return result
@@ -344,6 +540,8 @@ class TraconMixedScenario(BaseScenario):
         """
         Create an arrival aircraft at a waypoint
 
+        The flight's callsign must already be reserved (see _plan_arrival_jobs).
+
         Args:
             waypoint: Waypoint object from CIFP
             flight_data: Flight dictionary from API
@@ -351,7 +549,7 @@ class TraconMixedScenario(BaseScenario):
             active_runways: List of active runways
 
         Returns:
-            Aircraft object or None
+            Aircraft object
         """
         # Extract flight data
         departure = flight_data.get('departureAirport', 'KORD')
@@ -359,13 +557,6 @@ class TraconMixedScenario(BaseScenario):
         aircraft_type = flight_data.get('aircraftType', 'B738')
         route = clean_route_string(flight_data.get('route', ''))
 
-        # Check callsign uniqueness
-        with self.callsign_lock:
-            if callsign in self.used_callsigns:
-                logger.warning(f"Duplicate callsign {callsign}, skipping")
-                return None
-            self.used_callsigns.add(callsign)
-
         # Add equipment suffix
         is_ga = self._is_ga_aircraft_type(aircraft_type)
         aircraft_type = self._add_equipment_suffix(aircraft_type, is_ga)
@@ -437,7 +628,7 @@ class TraconMixedScenario(BaseScenario):
         """
         # First check if current waypoint has a speed limit
         if waypoint.speed_limit:
-            logger.debug(f"Found CIFP speed {waypoint.speed_limit} kts at waypoint {waypoint.name}")
+            logger.debug("Found CIFP speed %s kts at waypoint %s", waypoint.speed_limit, waypoint.name)
             return waypoint.speed_limit
 
         # If not, walk backwards through the STAR to find the most recent speed restriction
@@ -455,7 +646,7 @@ class TraconMixedScenario(BaseScenario):
         for seq in range(current_sequence - 10, 0, -10):
             for wpt_name, wpt in star_wpts.items():
                 if wpt.sequence_number == seq and wpt.speed_limit:
-                    logger.debug(f"Found CIFP speed {wpt.speed_limit} kts from previous waypoint {wpt_name} (seq {seq})")
+                    logger.debug("Found CIFP speed %s kts from previous waypoint %s (seq %s)", wpt.speed_limit, wpt_name, seq)
                     return wpt.speed_limit
 
         return None
@@ -488,37 +679,45 @@ class TraconMixedScenario(BaseScenario):
         if use_cifp_speeds and waypoint and star_name:
             cifp_speed = self._get_speed_from_cifp(waypoint, star_name)
             if cifp_speed:
-                logger.info(f"Using CIFP speed restriction: {cifp_speed} kts (aircraft: {aircraft_type})")
+                logger.info("Using CIFP speed restriction: %s kts (aircraft: %s)", cifp_speed, aircraft_type)
                 return cifp_speed
 
         # Fallback to altitude-based calculation
         # Determine if this is a GA aircraft
         is_ga = self._is_ga_aircraft_type(aircraft_type.split('/')[0])
+        speed = _arrival_speed(altitude, is_ga)
 
-        if is_ga:
-            # General aviation speeds are lower
-            # Base: 110 kts, increases to ~170 kts at high altitude
-            base_speed = 110
-            max_speed = 170
-        else:
-            # Jet/turboprop speeds
-            # Base: 140 kts (approach speed), max: 330 kts (yields ~310 kts at 18,000 ft)
-            base_speed = 140
-            max_speed = 330
+        logger.debug("Calculated arrival speed (altitude-based fallback): %s kts for altitude %s ft (aircraft: %s)", speed, altitude, aircraft_type)
+        return speed
 
-        # Exponential formula: speed = base + (max - base) * (1 - e^(-altitude / scale))
-        # Scale factor controls how quickly speed increases with altitude
-        scale_factor = 8000  # Altitude in feet where speed reaches ~63% of max
+    def _get_star_sequence_index(self, star_name: str) -> Dict[int, List[Tuple[str, object]]]:
+        """
+        Get a STAR's waypoints bucketed by sequence number, built once per scenario run.
 
-        import math
-        speed_ratio = 1 - math.exp(-altitude / scale_factor)
-        calculated_speed = base_speed + (max_speed - base_speed) * speed_ratio
+        Waypoints missing coordinates are filled in from the global CIFP waypoints
+        while the index is built.
 
-        # Round to nearest 5 knots for realism
-        speed = int(round(calculated_speed / 5) * 5)
+        Args:
+            star_name: STAR name (with numbers)
 
-        logger.debug(f"Calculated arrival speed (altitude-based fallback): {speed} kts for altitude {altitude} ft (aircraft: {aircraft_type})")
-        return speed
+        Returns:
+            Dict mapping sequence number to list of (waypoint_name, waypoint) tuples
+        """
+        seq_index = self._seq_index_cache.get(star_name)
+        if seq_index is not None:
+            return seq_index
+
+        seq_index = defaultdict(list)
+        for waypoint_name, waypoint in self.cifp_parser.star_waypoints.get(star_name, {}).items():
+            # Get coordinates from global waypoints if needed
+            if waypoint.latitude == 0.0 and waypoint.longitude == 0.0:
+                if waypoint_name in self.cifp_parser.waypoints:
+                    waypoint.latitude = self.cifp_parser.waypoints[waypoint_name].latitude
+                    waypoint.longitude = self.cifp_parser.waypoints[waypoint_name].longitude
+            seq_index[waypoint.sequence_number].append((waypoint_name, waypoint))
+
+        with self.cifp_cache_lock:
+            return self._seq_index_cache.setdefault(star_name, dict(seq_index))
 
     def _find_next_waypoint_for_runway(self, star_name: str, current_waypoint, runway: str):
         """
@@ -540,20 +739,10 @@ class TraconMixedScenario(BaseScenario):
 
         # Get all waypoints at the next sequence number
         next_sequence = current_waypoint.sequence_number + 10
-        candidate_waypoints = []
-
-        if star_name in self.cifp_parser.star_waypoints:
-            for waypoint_name, waypoint in self.cifp_parser.star_waypoints[star_name].items():
-                if waypoint.sequence_number == next_sequence:
-                    # Get coordinates from global waypoints if needed
-                    if waypoint.latitude == 0.0 and waypoint.longitude == 0.0:
-                        if waypoint_name in self.cifp_parser.waypoints:
-                            waypoint.latitude = self.cifp_parser.waypoints[waypoint_name].latitude
-                            waypoint.longitude = self.cifp_parser.waypoints[waypoint_name].longitude
-                    candidate_waypoints.append((waypoint_name, waypoint))
+        candidate_waypoints = self._get_star_sequence_index(star_name).get(next_sequence, [])
 
         if not candidate_waypoints:
-            logger.debug(f"No waypoints found at sequence {next_sequence} in {star_name}")
+            logger.debug("No waypoints found at sequence %s in %s", next_sequence, star_name)
             return None
 
         # If only one candidate, return it
@@ -562,40 +751,31 @@ class TraconMixedScenario(BaseScenario):
 
         # Multiple candidates - use CIFP transition_name to match runway
         # Normalize runway for comparison (e.g., "08L" -> "08L", "25R" -> "25R", "8" -> "08")
-        runway_normalized = runway.replace('RW', '')
-
-        # Pad single-digit runways with leading zero (8 -> 08, 8L -> 08L)
-        if len(runway_normalized) >= 1 and runway_normalized[0].isdigit():
-            if len(runway_normalized) == 1 or (len(runway_normalized) == 2 and not runway_normalized[1].isdigit()):
-                # Single digit runway (8 or 8L) - pad with zero
-                runway_normalized = '0' + runway_normalized
+        runway_normalized, runway_base = _normalize_runway(runway)
 
         # Build possible transition names to match
         # CIFP uses formats like "RW08", "RW08L", "RW25R", etc.
-        possible_transitions = [
-            f"RW{runway_normalized}",  # Exact: RW08L, RW25R
-            f"RW{runway_normalized[:-1]}" if len(runway_normalized) > 2 else None,  # Base: RW08 (from 08L)
-        ]
+        possible_transitions = {f"RW{runway_normalized}"}  # Exact: RW08L, RW25R
+        if len(runway_normalized) > 2:
+            possible_transitions.add(f"RW{runway_normalized[:-1]}")  # Base: RW08 (from 08L)
 
-        logger.debug(f"Looking for waypoints with transition names: {[t for t in possible_transitions if t]}")
+        logger.debug("Looking for waypoints with transition names: %s", possible_transitions)
 
         # First pass: exact transition name match
         for waypoint_name, waypoint in candidate_waypoints:
-            if waypoint.transition_name and waypoint.transition_name in possible_transitions:
-                logger.debug(f"Found waypoint {waypoint_name} for runway {runway} (transition: {waypoint.transition_name})")
+            if waypoint.transition_name in possible_transitions:
+                logger.debug("Found waypoint %s for runway %s (transition: %s)", waypoint_name, runway, waypoint.transition_name)
                 return waypoint
 
         # Second pass: reverse base match (transition RW08 can serve runway 08L or 08R)
         # This handles cases where CIFP defines RW08 transition that serves both 08L and 08R
-        runway_base = runway_normalized.rstrip('LRC')
         for waypoint_name, waypoint in candidate_waypoints:
             if waypoint.transition_name:
-                trans_clean = waypoint.transition_name.replace('RW', '')
-                trans_base = trans_clean.rstrip('LRC')
+                _, trans_base = _normalize_runway(waypoint.transition_name)
 
                 # Check if transition base matches runway base
                 if trans_base == runway_base:
-                    logger.debug(f"Found waypoint {waypoint_name} for runway {runway} via base match (transition: {waypoint.transition_name})")
+                    logger.debug("Found waypoint %s for runway %s via base match (transition: %s)", waypoint_name, runway, waypoint.transition_name)
                     return waypoint
 
         # If no match found, log warning and return first candidate
@@ -623,40 +803,72 @@ class TraconMixedScenario(BaseScenario):
         Returns:
             FRD string (e.g., "HOMRR02003")
         """
-        distance_nm = 3  # Always 3 NM from the waypoint
+        # The FRD depends only on the waypoint, STAR and runway - repeat entries reuse it
+        cache_key = (waypoint.name, star_name, runway)
+        frd_string = self._frd_cache.get(cache_key)
+        if frd_string is not None:
+            return frd_string
+
+        leg = self._frd_course_leg(waypoint, star_name, runway)
+        inbound_course = calculate_bearing(*leg) if leg else None
+
+        frd_string = self._format_frd_fix(waypoint, inbound_course)
+        with self.cifp_cache_lock:
+            self._frd_cache[cache_key] = frd_string
+        return frd_string
+
+    def _frd_course_leg(self, waypoint, star_name: str, runway: str) -> Optional[Tuple[float, float, float, float]]:
+        """
+        Find the procedure leg whose bearing gives the inbound course at a waypoint
+
+        Args:
+            waypoint: Waypoint object from CIFP
+            star_name: STAR name (with numbers)
+            runway: Runway designator (e.g., "08L", "25R")
+
+        Returns:
+            (lat1, lon1, lat2, lon2) tuple, or None if no leg could be determined
+        """
+        if not waypoint.sequence_number:
+            return None
 
         # Try to get the previous waypoint in the STAR to calculate actual lateral course
-        inbound_course = None
-        if waypoint.sequence_number:
-            prev_waypoint = self.cifp_parser.get_previous_waypoint_in_star(star_name, waypoint.sequence_number)
-            if prev_waypoint and prev_waypoint.latitude and prev_waypoint.longitude and waypoint.latitude and waypoint.longitude:
-                # Calculate bearing from previous waypoint to current waypoint
-                # This is the actual lateral course of the arrival TO this waypoint
-                inbound_course = calculate_bearing(
-                    prev_waypoint.latitude, prev_waypoint.longitude,
-                    waypoint.latitude, waypoint.longitude
-                )
-                logger.debug(f"Calculated inbound course from previous {prev_waypoint.name} to {waypoint.name}: {inbound_course:.1f}°")
-            else:
-                # No previous waypoint - this is a transition/entry point
-                # Use the next waypoint to determine the course that continues THROUGH the fix
-                # For STARs with multiple branches, find the correct next waypoint for this runway
-                next_waypoint = self._find_next_waypoint_for_runway(star_name, waypoint, runway)
-                if next_waypoint and next_waypoint.latitude and next_waypoint.longitude and waypoint.latitude and waypoint.longitude:
-                    # Calculate bearing from CURRENT to NEXT (the departure course from this fix)
-                    # We'll spawn aircraft on this same course line, BEFORE reaching the fix
-                    departure_course = calculate_bearing(
-                        waypoint.latitude, waypoint.longitude,
-                        next_waypoint.latitude, next_waypoint.longitude
-                    )
-                    # Use the departure course as the inbound course (aircraft arrive on same line)
-                    inbound_course = departure_course
-                    logger.debug(f"Using course from {waypoint.name} to next {next_waypoint.name} (for runway {runway}) as inbound: {inbound_course:.1f}°")
+        prev_waypoint = self.cifp_parser.get_previous_waypoint_in_star(star_name, waypoint.sequence_number)
+        if prev_waypoint and prev_waypoint.latitude and prev_waypoint.longitude and waypoint.latitude and waypoint.longitude:
+            # Bearing from previous waypoint to current waypoint
+            # This is the actual lateral course of the arrival TO this waypoint
+            logger.debug("Using inbound course from previous %s to %s", prev_waypoint.name, waypoint.name)
+            return (prev_waypoint.latitude, prev_waypoint.longitude, waypoint.latitude, waypoint.longitude)
+
+        # No previous waypoint - this is a transition/entry point
+        # Use the next waypoint to determine the course that continues THROUGH the fix
+        # For STARs with multiple branches, find the correct next waypoint for this runway
+        next_waypoint = self._find_next_waypoint_for_runway(star_name, waypoint, runway)
+        if next_waypoint and next_waypoint.latitude and next_waypoint.longitude and waypoint.latitude and waypoint.longitude:
+            # Bearing from CURRENT to NEXT (the departure course from this fix)
+            # Aircraft spawn on this same course line, BEFORE reaching the fix
+            logger.debug("Using course from %s to next %s (for runway %s) as inbound", waypoint.name, next_waypoint.name, runway)
+            return (waypoint.latitude, waypoint.longitude, next_waypoint.latitude, next_waypoint.longitude)
+
+        return None
+
+    def _format_frd_fix(self, waypoint, inbound_course: Optional[int]) -> str:
+        """
+        Build the FRD string for a waypoint from its inbound course
+
+        Args:
+            waypoint: Waypoint object from CIFP
+            inbound_course: Calculated inbound course, or None to use the CIFP fallback
+
+        Returns:
+            FRD string (e.g., "HOMRR02003")
+        """
+        distance_nm = 3  # Always 3 NM from the waypoint
 
         # Fallback to waypoint's inbound_course field if we couldn't calculate
         if inbound_course is None:
             inbound_course = waypoint.inbound_course if waypoint.inbound_course else 200
-            logger.debug(f"Using fallback inbound_course: {inbound_course}°")
+            logger.debug("Using fallback inbound_course: %s°", inbound_course)
 
         # Calculate the radial FROM the waypoint where aircraft is located
         # If flying inbound on course 200, aircraft is on the 020 radial FROM the fix
@@ -664,7 +876,7 @@ class TraconMixedScenario(BaseScenario):
 
         # Format: FIXRADIALDISTANCE (no slashes, radial=3 digits, distance=3 digits with leading zeros)
         frd_string = f"{waypoint.name}{radial_from_fix:03d}{distance_nm:03d}"
-        logger.debug(f"FRD: {frd_string} ({distance_nm}NM from {waypoint.name} on {radial_from_fix:03d} radial)")
+        logger.debug("FRD: %s (%dNM from %s on %03d radial)", frd_string, distance_nm, waypoint.name, radial_from_fix)
         return frd_string
 
     def _calculate_arrival_heading(self, waypoint, star_name: str) -> int:
@@ -705,9 +917,23 @@ class TraconMixedScenario(BaseScenario):
         if not active_runways:
             return "08L"
 
+        # Selection depends only on the active runways and the STAR, so repeat arrivals hit the cache
+        cache_key = (tuple(active_runways), star_name)
+        runway = self._runway_sel_cache.get(cache_key)
+        if runway is None:
+            runway = self._match_arrival_runway(active_runways, star_name)
+            with self.cifp_cache_lock:
+                self._runway_sel_cache[cache_key] = runway
+        return runway
+
+    def _match_arrival_runway(self, active_runways: List[str], star_name: str) -> str:
+        """Find the first active runway fed by the STAR (uncached helper for _select_arrival_runway)"""
         # Get runways that this STAR can feed (use full STAR name with numbers)
         star_runways = self.cifp_parser.get_runways_for_arrival(star_name)
 
+        # Normalize STAR runway numbers once (8 -> 08, 08L -> 08)
+        star_bases = {_normalize_runway(star_rwy)[1] for star_rwy in star_runways}
+
         # Find first active runway that matches this STAR
         # Handle exact matches, base matches, and normalized number matches
         for active_rwy in active_runways:
@@ -715,17 +941,9 @@ class TraconMixedScenario(BaseScenario):
             if active_rwy in star_runways:
                 return active_rwy
 
-            # Normalize runway numbers for comparison (8 -> 08, 9 -> 09)
-            active_base = active_rwy.rstrip('LRC')
-            active_normalized = active_base.zfill(2) if active_base.isdigit() else active_base
-
-            for star_rwy in star_runways:
-                star_base = star_rwy.rstrip('LRC')
-                star_normalized = star_base.zfill(2) if star_base.isdigit() else star_base
-
-                # Compare normalized bases (handles "8" == "08", "08L" == "08", etc.)
-                if active_normalized == star_normalized:
-                    return active_rwy
+            # Compare normalized bases (handles "8" == "08", "08L" == "08", etc.)
+            if _normalize_runway(active_rwy)[1] in star_bases:
+                return active_rwy
 
         # Fallback: use first active runway
         logger.warning(f"No active runway matches STAR {star_name} runways {star_runways}, using {active_runways[0]}")
@@ -753,7 +971,7 @@ class TraconMixedScenario(BaseScenario):
         runway_clean = runway.replace('RW', '')
 
         initial_path = f"{current_waypoint.name} {star_name}.{runway_clean}"
-        logger.debug(f"Initial path: {initial_path} (spawn 3NM before {current_waypoint.name})")
+        logger.debug("Initial path: %s (spawn 3NM before %s)", initial_path, current_waypoint.name)
         return initial_path
 
     def _strip_numbers(self, procedure: str) -> str:
@@ -761,27 +979,57 @@ class TraconMixedScenario(BaseScenario):
         return re.sub(r'\d+$', '', procedure)
 
     def _deduplicate_by_gufi(self, flights: List[Dict]) -> List[Dict]:
-        """Remove duplicate flights by GUFI"""
-        seen = set()
-        unique = []
+        """Remove duplicate flights by GUFI (flights without a GUFI are always kept)"""
+        # Insertion-ordered dict keeps the first flight per GUFI in original order
+        unique = {}
         for flight in flights:
-            gufi = flight.get('gufi', '')
-            if gufi and gufi not in seen:
-                seen.add(gufi)
-                unique.append(flight)
-            elif not gufi:
-                unique.append(flight)
-        return unique
-
-    def _group_flights_by_star(self, flights: List[Dict]) -> Dict[str, List[Dict]]:
-        """Group flights by their arrivalProcedure field"""
+            key = flight.get('gufi') or id(flight)
+            if key not in unique:
+                unique[key] = flight
+        return list(unique.values())
+
+    def _process_arrival_flights(self, flights: List[Dict]) -> Dict[str, List[Dict]]:
+        """
+        Filter valid flights, remove GUFI duplicates and group by arrivalProcedure in a single pass
+
+        Args:
+            flights: Raw flight dictionaries from the API
+
+        Returns:
+            Dict mapping uppercased STAR name to its flights, in API order
+        """
         groups = defaultdict(list)
+        seen_gufis = set()
+        valid_count = 0
+        unique_count = 0
         for flight in flights:
+            if not is_valid_flight(flight):
+                continue
+            valid_count += 1
+
+            gufi = flight.get('gufi')
+            if gufi:
+                if gufi in seen_gufis:
+                    continue
+                seen_gufis.add(gufi)
+            unique_count += 1
+
             star = flight.get('arrivalProcedure', 'UNKNOWN').upper()
             groups[star].append(flight)
-        return dict(groups)
 
-    def _parse_star_transitions(self, arrival_waypoints: List[str], active_runways: List[str] = None) -> List[Tuple[str, str]]:
+        if valid_count < len(flights):
+            logger.info(f"Filtered {len(flights) - valid_count} invalid flights, {valid_count} remain")
+        logger.info(f"Got {valid_count} valid arrival flights from API")
+        logger.info(f"After deduplication: {unique_count} unique arrival flights")
+        # Callers only use .get()/iteration, so the defaultdict is returned as-is
+        return groups
+
+    def _star_transition(self, waypoint_name: str, star_name: Optional[str]) -> Tuple[str, Optional[str], Optional[str]]:
+        """Build a (waypoint_name, star_name, star_base) transition triple"""
+        star_base = self._strip_numbers(star_name).upper() if star_name else None
+        return (waypoint_name, star_name, star_base)
+
+    def _parse_star_transitions(self, arrival_waypoints: List[str], active_runways: List[str] = None) -> List[Tuple[str, str, str]]:
         """
         Parse STAR waypoint input format
 
@@ -795,18 +1043,18 @@ class TraconMixedScenario(BaseScenario):
             active_runways: Optional list of active runways to filter random selection
 
         Returns:
-            List of (waypoint_name, star_name) tuples
+            List of (waypoint_name, star_name, star_base) tuples, where star_base is the
+            uppercased STAR name without numbers used to group API flights (None if no STAR)
         """
         # If no waypoints specified, get random STAR transitions from CIFP
         if not arrival_waypoints or (len(arrival_waypoints) == 1 and not arrival_waypoints[0].strip()):
             logger.info("No STAR waypoints specified, selecting random transitions from CIFP")
             # Select 3-5 random transitions
-            import random
             count = random.randint(3, 5)
             star_transitions = self.cifp_parser.get_random_star_transitions(count, active_runways)
             if star_transitions:
                 logger.info(f"Auto-selected {len(star_transitions)} random STAR transitions: {star_transitions}")
-                return star_transitions
+                return [self._star_transition(waypoint_name, star_name) for waypoint_name, star_name in star_transitions]
             else:
                 logger.error("No STAR transitions available in CIFP data")
                 return []
@@ -827,17 +1075,17 @@ class TraconMixedScenario(BaseScenario):
 
                     # If STAR part is empty, it means waypoint-only filtering
                     if not star_name:
-                        star_transitions.append((waypoint_name, None))
+                        star_transitions.append(self._star_transition(waypoint_name, None))
                         logger.debug(f"Parsed waypoint-only filter: {waypoint_name}")
                     else:
-                        star_transitions.append((waypoint_name, star_name))
+                        star_transitions.append(self._star_transition(waypoint_name, star_name))
                         logger.debug(f"Parsed STAR waypoint: {waypoint_name}.{star_name}")
                 else:
                     logger.warning(f"Invalid STAR waypoint format: {entry} (expected WAYPOINT.STAR)")
             else:
                 # Waypoint-only format (no STAR specified)
                 # This will match any STAR containing this waypoint
-                star_transitions.append((entry, None))
+                star_transitions.append(self._star_transition(entry, None))
                 logger.debug(f"Parsed waypoint-only filter: {entry}")
 
         return star_transitions
@@ -0,0 +1,112 @@
+"""
+Regenerate utils/airport_artcc_static.py
+
+Resolves POPULAR_US_AIRPORTS and LESS_COMMON_AIRPORTS to their ARTCC by testing each
+airport reference point from airport_data/FAACIFP18 against artcc_boundaries.geojson,
+the same geometry the live lookup uses. Airports without a reference point in the CIFP
+or outside every boundary are left out so they keep using the live lookup.
+
+Run from the repository root after updating the CIFP, the boundaries or the airport lists:
+
+    python tools/bake_airport_artcc.py
+"""
+import sys
+from pathlib import Path
+from typing import Dict, Optional, Tuple
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(REPO_ROOT))
+
+from utils.artcc_utils import get_artcc_boundaries
+from utils.constants import LESS_COMMON_AIRPORTS, POPULAR_US_AIRPORTS
+
+CIFP_PATH = REPO_ROOT / "airport_data" / "FAACIFP18"
+OUTPUT_PATH = REPO_ROOT / "utils" / "airport_artcc_static.py"
+
+HEADER = '''"""
+Precomputed ARTCC for the airports the scenarios use most
+
+Resolved offline for POPULAR_US_AIRPORTS and LESS_COMMON_AIRPORTS by testing
+each airport reference point from airport_data/FAACIFP18 against artcc_boundaries.geojson.
+Airports not listed here (or added through config) fall back to the live lookup.
+
+Generated by tools/bake_airport_artcc.py - rerun it (python tools/bake_airport_artcc.py)
+instead of editing this table when the CIFP, the boundaries or the airport lists change.
+"""
+
+# Airport ICAO -> ARTCC ID
+'''
+
+
+def parse_coordinate(coord_str: str, is_latitude: bool) -> Optional[float]:
+    """
+    Parse a CIFP coordinate (e.g., "N33260340" or "W112004170") into decimal degrees
+
+    Args:
+        coord_str: Hemisphere letter followed by degrees, minutes and hundredths of seconds
+        is_latitude: True for a latitude (2-digit degrees), False for a longitude (3-digit)
+
+    Returns:
+        Decimal degrees, or None if the field is blank or malformed
+    """
+    degree_digits = 2 if is_latitude else 3
+    try:
+        digits = coord_str[1:]
+        degrees = int(digits[:degree_digits])
+        minutes = int(digits[degree_digits:degree_digits + 2])
+        seconds = int(digits[degree_digits + 2:]) / 100.0
+    except (ValueError, IndexError):
+        return None
+
+    decimal = degrees + minutes / 60.0 + seconds / 3600.0
+    return -decimal if coord_str[0] in ('S', 'W') else decimal
+
+
+def load_airport_reference_points() -> Dict[str, Tuple[float, float]]:
+    """
+    Read every airport reference point (section P, subsection A) from the CIFP
+
+    Returns:
+        Dictionary of airport ICAO -> (latitude, longitude)
+    """
+    points = {}
+    with open(CIFP_PATH, 'r', encoding='utf-8', errors='ignore') as f:
+        for line in f:
+            if len(line) < 51 or line[4] != 'P' or line[12] != 'A':
+                continue
+
+            lat = parse_coordinate(line[32:41], True)
+            lon = parse_coordinate(line[41:51], False)
+            if lat is not None and lon is not None:
+                points[line[6:10].strip()] = (lat, lon)
+
+    return points
+
+
+def main():
+    reference_points = load_airport_reference_points()
+    boundaries = get_artcc_boundaries()
+
+    airport_to_artcc = {}
+    for airport_icao in dict.fromkeys(POPULAR_US_AIRPORTS + LESS_COMMON_AIRPORTS):
+        coords = reference_points.get(airport_icao)
+        if not coords:
+            print(f"Skipping {airport_icao}: no reference point in {CIFP_PATH.name}")
+            continue
+
+        artcc_id = boundaries.find_artcc_for_point(*coords)
+        if not artcc_id:
+            print(f"Skipping {airport_icao}: outside every ARTCC boundary")
+            continue
+
+        airport_to_artcc[airport_icao] = artcc_id
+
+    entries = [f'"{airport_icao}": "{artcc_id}",' for airport_icao, artcc_id in airport_to_artcc.items()]
+    rows = ["    " + " ".join(entries[i:i + 5]) for i in range(0, len(entries), 5)]
+    OUTPUT_PATH.write_text(HEADER + "AIRPORT_TO_ARTCC = {\n" + "\n".join(rows) + "\n}\n")
+
+    print(f"Wrote {len(airport_to_artcc)} airports to {OUTPUT_PATH.relative_to(REPO_ROOT)}")
+
+
+if __name__ == "__main__":
+    main()
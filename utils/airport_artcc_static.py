@@ -0,0 +1,30 @@
+"""
+Precomputed ARTCC for the airports the scenarios use most
+
+Resolved offline for POPULAR_US_AIRPORTS and LESS_COMMON_AIRPORTS by testing
+each airport reference point from airport_data/FAACIFP18 against artcc_boundaries.geojson.
+Airports not listed here (or added through config) fall back to the live lookup.
+
+Generated by tools/bake_airport_artcc.py - rerun it (python tools/bake_airport_artcc.py)
+instead of editing this table when the CIFP, the boundaries or the airport lists change.
+"""
+
+# Airport ICAO -> ARTCC ID
+AIRPORT_TO_ARTCC = {
+    "KATL": "ZTL", "KLAX": "ZLA", "KORD": "ZAU", "KDFW": "ZFW", "KDEN": "ZDV",
+    "KJFK": "ZNY", "KSFO": "ZOA", "KLAS": "ZLA", "KSEA": "ZSE", "KMCO": "ZMA",
+    "KEWR": "ZNY", "KMIA": "ZMA", "KIAH": "ZHU", "KBOS": "ZBW", "KMSP": "ZMP",
+    "KFLL": "ZMA", "KDTW": "ZOB", "KPHL": "ZDC", "KLGA": "ZNY", "KBWI": "ZDC",
+    "KSLC": "ZLC", "KDCA": "ZDC", "KSAN": "ZLA", "KTPA": "ZJX", "KPDX": "ZSE",
+    "KSTL": "ZKC", "KMDW": "ZAU", "KBNA": "ZME", "KAUS": "ZHU", "KOAK": "ZOA",
+    "KSNA": "ZLA", "KMSY": "ZHU", "KSMF": "ZOA", "KSAT": "ZHU", "KRSW": "ZMA",
+    "KPBI": "ZMA", "KCMH": "ZID", "KPIT": "ZOB", "KCLE": "ZOB", "KBUR": "ZLA",
+    "KONT": "ZLA", "KABQ": "ZAB", "KSJC": "ZOA", "KBDL": "ZBW", "KPVD": "ZBW",
+    "KMKE": "ZAU", "KRDU": "ZDC", "KCLT": "ZTL", "KPHX": "ZAB", "KSDL": "ZAB",
+    "KDVT": "ZAB", "KCHD": "ZAB", "KGEU": "ZAB", "KFFZ": "ZAB", "KIWA": "ZAB",
+    "KBXK": "ZAB", "KPRC": "ZAB", "KGYR": "ZAB", "KTUS": "ZAB", "KFLG": "ZAB",
+    "KIGM": "ZLA", "KPGA": "ZDV", "KGCN": "ZLA", "KSEZ": "ZAB", "KINW": "ZAB",
+    "KCGZ": "ZAB", "KBLH": "ZLA", "KIFP": "ZLA", "KBYS": "ZLA", "KSGU": "ZLA",
+    "KCDC": "ZLC", "KLUF": "ZAB", "KFUL": "ZLA", "KEMT": "ZLA", "KVNY": "ZLA",
+    "KHND": "ZLA", "KBVU": "ZLA",
+}
@@ -2,11 +2,14 @@
 Utility functions for fetching airport data
 """
 import logging
-from typing import Optional
-from flightradar24.api import FlightRadar24API
+from typing import Dict, Optional
 
 logger = logging.getLogger(__name__)
 
+# Elevations already fetched this session, keyed by airport ICAO
+# Failed lookups are not stored so they are retried on the next call
+_elevation_cache: Dict[str, int] = {}
+
 
 def get_airport_elevation(airport_icao: str) -> Optional[int]:
     """
@@ -18,7 +21,13 @@ def get_airport_elevation(airport_icao: str) -> Optional[int]:
     Returns:
         Elevation in feet MSL, or None if not found
     """
+    if airport_icao in _elevation_cache:
+        return _elevation_cache[airport_icao]
+
     try:
+        # Imported here so modules that only parse airport data don't load the FR24 client
+        from flightradar24.api import FlightRadar24API
+
         fr_api = FlightRadar24API()
 
         # Remove 'K' prefix if present (FlightRadar24 uses 3-letter codes)
@@ -29,24 +38,19 @@ def get_airport_elevation(airport_icao: str) -> Optional[int]:
         # Fetch airport details
         airport_data = fr_api.get_airport_details(airport_code)
 
-        # Navigate to elevation
-        if (airport_data and
-            'airport' in airport_data and
-            airport_data['airport'] and
-            'pluginData' in airport_data['airport']):
+        # Navigate to airport -> pluginData -> details -> position -> elevation
+        elevation = (((((airport_data or {}).get('airport') or {})
+                       .get('pluginData') or {})
+                      .get('details') or {})
+                     .get('position') or {}).get('elevation')
 
-            plugin_data = airport_data['airport']['pluginData']
+        if elevation is None:
+            logger.warning(f"Could not find elevation for {airport_icao}")
+            return None
 
-            if ('details' in plugin_data and
-                'position' in plugin_data['details'] and
-                'elevation' in plugin_data['details']['position']):
-
-                elevation = plugin_data['details']['position']['elevation']
-                logger.info(f"Fetched elevation for {airport_icao}: {elevation} ft MSL")
-                return int(elevation)
-
-        logger.warning(f"Could not find elevation for {airport_icao}")
-        return None
+        logger.info(f"Fetched elevation for {airport_icao}: {elevation} ft MSL")
+        _elevation_cache[airport_icao] = int(elevation)
+        return _elevation_cache[airport_icao]
 
     except Exception as e:
         logger.error(f"Error fetching elevation for {airport_icao}: {e}")
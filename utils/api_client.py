@@ -2,17 +2,34 @@
 API client for fetching real flight data from creativeshrimp.work.gd
 """
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+import threading
 import time
+from concurrent.futures import ThreadPoolExecutor
 from typing import Optional, Dict, Any, List
 import logging
+from utils.flight_data_filter import strip_procedure_number
+from utils.json_utils import json_loads
 
 logger = logging.getLogger(__name__)
 
 
+class _CappedRetry(Retry):
+    """Retry policy that never waits longer than MAX_RETRY_AFTER seconds for a server's Retry-After"""
+
+    MAX_RETRY_AFTER = 60.0
+
+    def parse_retry_after(self, retry_after: str) -> float:
+        # A long Retry-After would otherwise block the GUI's fetch threads for that long
+        return min(super().parse_retry_after(retry_after), self.MAX_RETRY_AFTER)
+
+
 class FlightDataAPIClient:
     """Client for fetching real flight data from the Creative Shrimp API"""
 
     BASE_URL = "http://creativeshrimp.work.gd:3000/flights"
+    MAX_CACHE_ENTRIES = 256  # Oldest entries are evicted beyond this
 
     def __init__(self, cache_timeout: int = 3600):
         """
@@ -21,8 +38,37 @@ class FlightDataAPIClient:
         Args:
             cache_timeout: How long to cache results in seconds (default: 1 hour)
         """
-        self.cache: Dict[str, tuple] = {}
+        self.cache: Dict[tuple, tuple] = {}
         self.cache_timeout = cache_timeout
+        self.cache_lock = threading.Lock()  # GUI fetches departures and arrivals in parallel
+
+        # Shared session so repeated queries reuse keep-alive connections to the API
+        # Failed connections, timeouts, rate limits and server errors are retried by the adapter
+        # with jittered exponential backoff (capped at 30s), honoring the server's Retry-After
+        # header on 429s up to 60s. The jitter keeps parallel fetches from retrying in lockstep.
+        retry = _CappedRetry(
+            total=3,
+            backoff_factor=1.0,
+            backoff_max=30.0,
+            backoff_jitter=1.0,
+            status_forcelist=(429, 500, 502, 503, 504),
+            allowed_methods=frozenset(['GET']),
+            respect_retry_after_header=True
+        )
+        self.session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=10, pool_maxsize=20, max_retries=retry)
+        self.session.mount('http://', adapter)
+        self.session.mount('https://', adapter)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+    def close(self):
+        """Close the underlying HTTP session and its pooled connections"""
+        self.session.close()
 
     @staticmethod
     def _strip_procedure_numbers(procedure: str) -> str:
@@ -35,9 +81,8 @@ class FlightDataAPIClient:
         Returns:
             Procedure name without numeric suffix
         """
-        import re
         # Remove trailing digits from procedure name
-        return re.sub(r'\d+$', '', procedure)
+        return strip_procedure_number(procedure)
 
     @staticmethod
     def _format_procedures_for_api(procedures: Optional[List[str]]) -> Optional[str]:
@@ -53,13 +98,13 @@ class FlightDataAPIClient:
         if not procedures:
             return None
 
-        # Strip numbers from all procedures and join with '+'
-        # requests.get() will URL-encode this to '%2B' automatically
-        stripped_procs = [FlightDataAPIClient._strip_procedure_numbers(proc) for proc in procedures]
-        # Remove any empty strings and duplicates
-        stripped_procs = list(dict.fromkeys([p for p in stripped_procs if p]))
+        # Strip numbers from all procedures in one pass, skipping empty strings and duplicates
+        stripped_procs = {strip_procedure_number(proc) for proc in procedures}
+        stripped_procs.discard('')
 
-        return '+'.join(stripped_procs) if stripped_procs else None
+        # Sort so the same procedures in any order give the same parameter (and cache key)
+        # Join with '+' - requests will URL-encode this to '%2B' automatically
+        return '+'.join(sorted(stripped_procs)) if stripped_procs else None
 
     def _calculate_cruise_speed(self, aircraft_type: str) -> int:
         """
@@ -72,7 +117,7 @@ class FlightDataAPIClient:
             Cruise speed in knots (default: 450 for jets)
         """
         # Simple fallback - API should provide actual cruise speeds
-        logger.debug(f"Using default cruise speed fallback for: {aircraft_type}")
+        logger.debug("Using default cruise speed fallback for: %s", aircraft_type)
         return 450
 
     def fetch_flights(
@@ -80,7 +125,6 @@ class FlightDataAPIClient:
         departure: Optional[str] = None,
         arrival: Optional[str] = None,
         limit: int = 200,
-        retries: int = 3,
         depproc: Optional[str] = None,
         arrproc: Optional[str] = None
     ) -> Optional[List[Dict[str, Any]]]:
@@ -91,7 +135,6 @@ class FlightDataAPIClient:
             departure: Departure airport ICAO code (use "any" for all departures)
             arrival: Arrival airport ICAO code (use "any" for all arrivals)
             limit: Maximum number of flights to request (API returns up to this many)
-            retries: Number of retries if request fails
             depproc: URL-encoded departure procedures filter (e.g., 'EAGUL%2BZZULU')
             arrproc: URL-encoded arrival procedures filter (e.g., 'STAR1%2BSTAR2')
 
@@ -103,14 +146,13 @@ class FlightDataAPIClient:
         arr = arrival or "any"
         dep_proc = depproc or "none"
         arr_proc = arrproc or "none"
-        cache_key = f"{dep}:{arr}:{limit}:{dep_proc}:{arr_proc}"
+        cache_key = (dep, arr, limit, dep_proc, arr_proc)
 
         # Check cache
-        if cache_key in self.cache:
-            cached_data, timestamp = self.cache[cache_key]
-            if time.time() - timestamp < self.cache_timeout:
-                logger.debug(f"Using cached data for {cache_key}")
-                return cached_data
+        cached_data = self._get_cached(cache_key)
+        if cached_data is not None:
+            logger.debug("Using cached data for %s -> %s (%s/%s)", dep, arr, dep_proc, arr_proc)
+            return cached_data
 
         # Build request parameters
         params = {}
@@ -123,81 +165,50 @@ class FlightDataAPIClient:
         if arrproc:
             params['arrproc'] = arrproc
 
-        # Try to fetch from API
-        for attempt in range(retries):
+        # Log all parameters including procedures
+        log_msg = f"Fetching flights: departure={dep}, arrival={arr}, limit={limit}"
+        if depproc:
+            log_msg += f", depproc={depproc}"
+        if arrproc:
+            log_msg += f", arrproc={arrproc}"
+        logger.info(log_msg)
+
+        flights = self._request_flights(params, limit, timeout=15, description=f"{dep} -> {arr}")
+
+        # Cache the result
+        if flights:
+            self._store_cached(cache_key, flights)
+
+        return flights
+
+    def fetch_flights_bulk(
+        self,
+        queries: List[Dict[str, Any]],
+        max_workers: int = 8
+    ) -> List[Optional[List[Dict[str, Any]]]]:
+        """
+        Run several independent flight queries concurrently over the shared session
+
+        Args:
+            queries: List of fetch_flights keyword arguments (e.g., {'departure': 'KDEN', 'limit': 800})
+            max_workers: Maximum number of requests in flight at once
+
+        Returns:
+            List of fetch_flights results, in the same order as queries
+            (a query that raises is logged and yields an empty list)
+        """
+        if not queries:
+            return []
+
+        def run_query(query: Dict[str, Any]) -> Optional[List[Dict[str, Any]]]:
             try:
-                # Log all parameters including procedures
-                log_msg = f"Fetching flights: departure={dep}, arrival={arr}, limit={limit}"
-                if depproc:
-                    log_msg += f", depproc={depproc}"
-                if arrproc:
-                    log_msg += f", arrproc={arrproc}"
-                log_msg += f" (attempt {attempt + 1}/{retries})"
-                logger.info(log_msg)
-
-                # Log the full URL for debugging
-                logger.debug(f"API URL: {self.BASE_URL}, params: {params}")
-
-                response = requests.get(self.BASE_URL, params=params, timeout=15)
-
-                if response.status_code == 200:
-                    data = response.json()
-
-                    # Validate response structure
-                    if not isinstance(data, dict) or 'success' not in data:
-                        logger.error(f"Invalid API response structure: {data}")
-                        return None
-
-                    if not data.get('success'):
-                        logger.warning(f"API returned success=false: {data}")
-                        return None
-
-                    # Extract flight data
-                    flights = data.get('data', [])
-
-                    if not flights:
-                        logger.warning(f"No flights found for {dep} -> {arr}")
-                        return []
-
-                    # Limit to requested count
-                    flights = flights[:limit]
-
-                    logger.info(f"Fetched {len(flights)} flights from API ({dep} -> {arr})")
-
-                    # Cache the result
-                    self.cache[cache_key] = (flights, time.time())
-
-                    return flights
-
-                elif response.status_code == 429:
-                    # Rate limited, wait and retry
-                    wait_time = (attempt + 1) * 2
-                    logger.warning(f"Rate limited, waiting {wait_time}s before retry")
-                    time.sleep(wait_time)
-                else:
-                    logger.warning(f"API returned status code {response.status_code}")
-                    if attempt < retries - 1:
-                        time.sleep(1)
-
-            except requests.exceptions.Timeout:
-                logger.error(f"Request timeout (attempt {attempt + 1}/{retries})")
-                if attempt < retries - 1:
-                    time.sleep(2)
-            except requests.exceptions.RequestException as e:
-                logger.error(f"Network error fetching flights (attempt {attempt + 1}/{retries}): {e}")
-                if attempt < retries - 1:
-                    time.sleep(2)
-            except (KeyError, ValueError, TypeError) as e:
-                logger.error(f"Error parsing API response (attempt {attempt + 1}/{retries}): {e}")
-                if attempt < retries - 1:
-                    time.sleep(1)
+                return self.fetch_flights(**query)
             except Exception as e:
-                logger.error(f"Unexpected error fetching flights (attempt {attempt + 1}/{retries}): {e}")
-                if attempt < retries - 1:
-                    time.sleep(1)
+                logger.error("Error fetching flights for %s: %s", query, e)
+                return []
 
-        logger.error(f"Failed to fetch flights after {retries} attempts")
-        return None
+        with ThreadPoolExecutor(max_workers=min(max_workers, len(queries))) as executor:
+            return list(executor.map(run_query, queries))
 
     def fetch_departures(
         self,
@@ -269,89 +280,138 @@ class FlightDataAPIClient:
             List of flight dictionaries or None if request fails
         """
         # Build cache key
-        cache_key = f"artcc:{artcc_id}:{limit}"
+        cache_key = ('artcc', artcc_id, limit)
 
         # Check cache
-        if cache_key in self.cache:
-            cached_data, timestamp = self.cache[cache_key]
-            if time.time() - timestamp < self.cache_timeout:
-                logger.debug(f"Using cached data for ARTCC {artcc_id}")
-                return cached_data
+        cached_data = self._get_cached(cache_key)
+        if cached_data is not None:
+            logger.debug("Using cached data for ARTCC %s", artcc_id)
+            return cached_data
 
         # Build request parameters with ARTCC (prefix with K)
         params = {
             'artcc': f"K{artcc_id.upper()}"
         }
 
-        # Try to fetch from API
-        retries = 3
-        for attempt in range(retries):
-            try:
-                logger.info(f"Fetching flights for ARTCC {artcc_id}, limit={limit} (attempt {attempt + 1}/{retries})")
-                logger.debug(f"API URL: {self.BASE_URL}, params: {params}")
-
-                response = requests.get(self.BASE_URL, params=params, timeout=30)
-
-                if response.status_code == 200:
-                    data = response.json()
-
-                    # Validate response structure
-                    if not isinstance(data, dict) or 'success' not in data:
-                        logger.error(f"Invalid API response structure: {data}")
-                        return None
-
-                    if not data.get('success'):
-                        logger.warning(f"API returned success=false: {data}")
-                        return None
-
-                    # Extract flight data
-                    flights = data.get('data', [])
-
-                    if not flights:
-                        logger.warning(f"No flights found for ARTCC {artcc_id}")
-                        return []
-
-                    # Limit to requested count
-                    flights = flights[:limit]
-
-                    logger.info(f"Fetched {len(flights)} flights for ARTCC {artcc_id}")
-
-                    # Cache the result
-                    self.cache[cache_key] = (flights, time.time())
-
-                    return flights
-
-                elif response.status_code == 429:
-                    # Rate limited, wait and retry
-                    wait_time = (attempt + 1) * 2
-                    logger.warning(f"Rate limited, waiting {wait_time}s before retry")
-                    time.sleep(wait_time)
-                else:
-                    logger.warning(f"API returned status code {response.status_code}")
-                    if attempt < retries - 1:
-                        time.sleep(1)
-
-            except requests.exceptions.Timeout:
-                logger.error(f"Request timeout (attempt {attempt + 1}/{retries})")
-                if attempt < retries - 1:
-                    time.sleep(2)
-            except requests.exceptions.RequestException as e:
-                logger.error(f"Network error fetching ARTCC flights (attempt {attempt + 1}/{retries}): {e}")
-                if attempt < retries - 1:
-                    time.sleep(2)
-            except (KeyError, ValueError, TypeError) as e:
-                logger.error(f"Error parsing API response (attempt {attempt + 1}/{retries}): {e}")
-                if attempt < retries - 1:
-                    time.sleep(1)
-            except Exception as e:
-                logger.error(f"Unexpected error fetching ARTCC flights (attempt {attempt + 1}/{retries}): {e}")
-                if attempt < retries - 1:
-                    time.sleep(1)
+        logger.info("Fetching flights for ARTCC %s, limit=%s", artcc_id, limit)
+
+        flights = self._request_flights(params, limit, timeout=30, description=f"ARTCC {artcc_id}")
+
+        # Cache the result
+        if flights:
+            self._store_cached(cache_key, flights)
+
+        return flights
+
+    def _request_flights(
+        self,
+        params: Dict[str, str],
+        limit: int,
+        timeout: int,
+        description: str
+    ) -> Optional[List[Dict[str, Any]]]:
+        """
+        Query the flights endpoint once (retries are handled by the session's adapter)
+
+        Args:
+            params: Query parameters
+            limit: Maximum number of flights to return
+            timeout: Request timeout in seconds
+            description: What is being fetched, for log messages (e.g., "KDEN -> any")
+
+        Returns:
+            List of flight dictionaries, empty list if none found, or None if request fails
+        """
+        try:
+            # Log the full URL for debugging
+            logger.debug("API URL: %s, params: %s", self.BASE_URL, params)
+
+            response = self.session.get(self.BASE_URL, params=params, timeout=timeout)
+
+            if response.status_code != 200:
+                logger.error("API returned status code %s fetching %s", response.status_code, description)
+                return None
+
+            data = json_loads(response.content)
+
+            # Validate response structure
+            if not isinstance(data, dict) or 'success' not in data:
+                logger.error("Invalid API response structure: %s", data)
+                return None
+
+            if not data.get('success'):
+                logger.warning("API returned success=false: %s", data)
+                return None
+
+            # Extract flight data
+            flights = data.get('data', [])
+
+            if not flights:
+                logger.warning("No flights found for %s", description)
+                return []
+
+            # Limit to requested count
+            flights = flights[:limit]
+
+            logger.info("Fetched %s flights from API (%s)", len(flights), description)
+            return flights
+
+        except requests.exceptions.RequestException as e:
+            # Covers timeouts and connection errors once the adapter's retries run out
+            logger.error("Network error fetching %s: %s", description, e)
+        except Exception as e:
+            logger.error("Error handling API response for %s: %s", description, e)
 
-        logger.error(f"Failed to fetch ARTCC flights after {retries} attempts")
         return None
 
+    def _get_cached(self, cache_key: tuple) -> Optional[List[Dict[str, Any]]]:
+        """
+        Look up cached flights, dropping the entry if it has expired
+
+        Args:
+            cache_key: Cache key for the query
+
+        Returns:
+            Cached list of flights, or None if not cached or expired
+        """
+        with self.cache_lock:
+            entry = self.cache.get(cache_key)
+            if entry is None:
+                return None
+
+            cached_data, expiry = entry
+            if expiry > time.monotonic():
+                return cached_data
+
+            del self.cache[cache_key]
+            return None
+
+    def _store_cached(self, cache_key: tuple, flights: List[Dict[str, Any]]):
+        """
+        Cache flights for a query, keeping the cache within MAX_CACHE_ENTRIES
+
+        Expired entries are purged first, then the oldest remaining ones.
+
+        Args:
+            cache_key: Cache key for the query
+            flights: List of flights to cache
+        """
+        now = time.monotonic()
+        with self.cache_lock:
+            # Re-insert so the entry moves to the newest position
+            self.cache.pop(cache_key, None)
+            self.cache[cache_key] = (flights, now + self.cache_timeout)
+
+            if len(self.cache) > self.MAX_CACHE_ENTRIES:
+                expired = [key for key, (_, expiry) in self.cache.items() if expiry <= now]
+                for key in expired:
+                    del self.cache[key]
+
+                while len(self.cache) > self.MAX_CACHE_ENTRIES:
+                    del self.cache[next(iter(self.cache))]
+
     def clear_cache(self):
         """Clear all cached flight data"""
-        self.cache.clear()
+        with self.cache_lock:
+            self.cache.clear()
         logger.info("Flight data cache cleared")
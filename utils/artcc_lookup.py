@@ -1,13 +1,16 @@
 """
 ARTCC geographic lookup using boundary polygons
 """
-import json
 import logging
-from pathlib import Path
-from typing import Optional, Tuple
+from typing import Dict, Optional, Sequence, Tuple
+from utils.airport_artcc_static import AIRPORT_TO_ARTCC
 
 logger = logging.getLogger(__name__)
 
+# Airport coordinates already fetched this session, keyed by airport ICAO
+# Failed lookups are not stored so they are retried on the next call
+_coordinates_cache: Dict[str, Tuple[float, float]] = {}
+
 
 def point_in_polygon(lat: float, lon: float, polygon_coords: list) -> bool:
     """
@@ -21,21 +24,48 @@ def point_in_polygon(lat: float, lon: float, polygon_coords: list) -> bool:
     Returns:
         True if point is inside polygon, False otherwise
     """
-    # Ray casting algorithm
-    inside = False
-    n = len(polygon_coords)
+    ring_lons, ring_lats = split_ring(polygon_coords)
+    return point_in_ring(lat, lon, ring_lons, ring_lats)
+
+
+def split_ring(polygon_coords: list) -> Tuple[Tuple[float, ...], Tuple[float, ...]]:
+    """
+    Split a GeoJSON ring into separate longitude and latitude sequences
+
+    Args:
+        polygon_coords: List of [lon, lat] coordinate pairs defining the polygon
+
+    Returns:
+        Tuple of (longitudes, latitudes)
+    """
+    ring_lons = tuple(coord[0] for coord in polygon_coords)
+    ring_lats = tuple(coord[1] for coord in polygon_coords)
+    return ring_lons, ring_lats
+
+
+def point_in_ring(lat: float, lon: float, ring_lons: Sequence[float], ring_lats: Sequence[float]) -> bool:
+    """
+    Check if a point is inside a ring stored as separate longitude/latitude sequences
 
-    p1_lon, p1_lat = polygon_coords[0]
-    for i in range(1, n + 1):
-        p2_lon, p2_lat = polygon_coords[i % n]
+    Args:
+        lat: Latitude of the point
+        lon: Longitude of the point
+        ring_lons: Longitudes of the ring vertices
+        ring_lats: Latitudes of the ring vertices (same length as ring_lons)
+
+    Returns:
+        True if point is inside the ring, False otherwise
+    """
+    # Ray casting algorithm - walk each edge (previous vertex -> vertex), starting with the closing edge
+    inside = False
+    p1_lon = ring_lons[-1]
+    p1_lat = ring_lats[-1]
 
-        if lat > min(p1_lat, p2_lat):
-            if lat <= max(p1_lat, p2_lat):
-                if lon <= max(p1_lon, p2_lon):
-                    if p1_lat != p2_lat:
-                        x_intersect = (lat - p1_lat) * (p2_lon - p1_lon) / (p2_lat - p1_lat) + p1_lon
-                    if p1_lon == p2_lon or lon <= x_intersect:
-                        inside = not inside
+    for p2_lon, p2_lat in zip(ring_lons, ring_lats):
+        # The edge crosses the point's latitude when exactly one end lies below it, which
+        # rules out horizontal edges, so the intersection longitude is always defined
+        if (p1_lat < lat) != (p2_lat < lat):
+            inside ^= lon <= (lat - p1_lat) * (p2_lon - p1_lon) / (p2_lat - p1_lat) + p1_lon
 
         p1_lon, p1_lat = p2_lon, p2_lat
 
@@ -52,6 +82,9 @@ def get_airport_coordinates(airport_icao: str) -> Optional[Tuple[float, float]]:
     Returns:
         Tuple of (latitude, longitude) or None if not found
     """
+    if airport_icao in _coordinates_cache:
+        return _coordinates_cache[airport_icao]
+
     try:
         from flightradar24.api import FlightRadar24API
 
@@ -81,6 +114,7 @@ def get_airport_coordinates(airport_icao: str) -> Optional[Tuple[float, float]]:
                 lon = plugin_data['details']['position']['longitude']
 
                 logger.info(f"Fetched coordinates for {airport_icao}: {lat}, {lon}")
+                _coordinates_cache[airport_icao] = (lat, lon)
                 return (lat, lon)
 
         logger.warning(f"Could not find coordinates for {airport_icao}")
@@ -101,6 +135,12 @@ def get_artcc_for_airport(airport_icao: str) -> str:
     Returns:
         ARTCC ID (e.g., 'ZAB') or 'ZAB' as default if not found
     """
+    # Common airports are resolved ahead of time - no network or geometry needed
+    artcc_id = AIRPORT_TO_ARTCC.get(airport_icao.upper())
+    if artcc_id:
+        logger.info(f"Airport {airport_icao} is in ARTCC {artcc_id}")
+        return artcc_id
+
     try:
         # Get airport coordinates
         coords = get_airport_coordinates(airport_icao)
@@ -110,32 +150,12 @@ def get_artcc_for_airport(airport_icao: str) -> str:
 
         lat, lon = coords
 
-        # Load ARTCC boundaries
-        boundaries_path = Path(__file__).parent / "artcc_boundaries.geojson"
-        with open(boundaries_path, 'r') as f:
-            boundaries_data = json.load(f)
-
-        # Check each ARTCC boundary
-        for feature in boundaries_data.get('features', []):
-            artcc_id = feature.get('properties', {}).get('id')
-            geometry = feature.get('geometry', {})
-
-            if geometry.get('type') == 'Polygon':
-                # Polygon has one ring (exterior boundary)
-                coords_ring = geometry.get('coordinates', [[]])[0]
-
-                if point_in_polygon(lat, lon, coords_ring):
-                    logger.info(f"Airport {airport_icao} is in ARTCC {artcc_id}")
-                    return artcc_id
-
-            elif geometry.get('type') == 'MultiPolygon':
-                # MultiPolygon has multiple rings
-                for polygon in geometry.get('coordinates', []):
-                    coords_ring = polygon[0]  # First ring is exterior boundary
-
-                    if point_in_polygon(lat, lon, coords_ring):
-                        logger.info(f"Airport {airport_icao} is in ARTCC {artcc_id}")
-                        return artcc_id
+        # Boundaries are parsed once and shared with the enroute scenario code
+        from utils.artcc_utils import get_artcc_boundaries
+        artcc_id = get_artcc_boundaries().find_artcc_for_point(lat, lon)
+        if artcc_id:
+            logger.info(f"Airport {airport_icao} is in ARTCC {artcc_id}")
+            return artcc_id
 
         logger.warning(f"Airport {airport_icao} not found in any ARTCC boundary, defaulting to ZAB")
         return "ZAB"
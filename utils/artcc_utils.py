@@ -2,11 +2,11 @@
 ARTCC Boundary Utilities for Enroute Scenarios
 Provides functions for working with ARTCC geographic boundaries
 """
-import json
 import logging
 from pathlib import Path
 from typing import Optional, List, Tuple, Dict
-from utils.artcc_lookup import point_in_polygon
+from utils.artcc_lookup import point_in_ring, split_ring
+from utils.json_utils import json_loads
 
 logger = logging.getLogger(__name__)
 
@@ -14,10 +14,22 @@ logger = logging.getLogger(__name__)
 class ARTCCBoundaries:
     """ARTCC boundary data manager"""
 
+    __slots__ = (
+        'boundaries_data', '_loaded', '_features_by_id', '_rings_by_id', '_bbox_by_id', '_artcc_areas'
+    )
+
     def __init__(self):
         """Initialize ARTCC boundary manager"""
         self.boundaries_data: Optional[Dict] = None
         self._loaded = False
+        # Lookup tables below are keyed by upper-case ARTCC ID, normalized once at load
+        self._features_by_id: Dict[str, Dict] = {}
+        # Exterior rings per ARTCC as (longitudes, latitudes), built once at load for point checks
+        self._rings_by_id: Dict[str, List[Tuple[Tuple[float, ...], Tuple[float, ...]]]] = {}
+        # Extent of those rings as (min_lon, min_lat, max_lon, max_lat), for cheap early rejection
+        self._bbox_by_id: Dict[str, Tuple[float, float, float, float]] = {}
+        # (artcc_id, bbox, rings) in file order, so point lookups are a flat list scan
+        self._artcc_areas: List[Tuple[str, Tuple[float, float, float, float], List]] = []
 
     def _ensure_loaded(self):
         """Lazy load ARTCC boundary data on first access"""
@@ -29,8 +41,8 @@ class ARTCCBoundaries:
         """Load ARTCC boundaries from GeoJSON file"""
         try:
             boundaries_path = Path(__file__).parent / "artcc_boundaries.geojson"
-            with open(boundaries_path, 'r') as f:
-                self.boundaries_data = json.load(f)
+            with open(boundaries_path, 'rb') as f:
+                self.boundaries_data = json_loads(f.read())
 
             logger.info(f"Loaded {len(self.boundaries_data.get('features', []))} ARTCC boundaries")
 
@@ -38,6 +50,32 @@ class ARTCCBoundaries:
             logger.error(f"Error loading ARTCC boundaries: {e}")
             self.boundaries_data = {"type": "FeatureCollection", "features": []}
 
+        self._features_by_id = {}
+        self._rings_by_id = {}
+        self._bbox_by_id = {}
+        self._artcc_areas = []
+        for feature in self.boundaries_data.get('features', []):
+            artcc_id = feature.get('properties', {}).get('id')
+            if not artcc_id:
+                continue
+
+            # First feature wins if an ID is ever repeated
+            artcc_key = artcc_id.upper()
+            if artcc_key in self._features_by_id:
+                continue
+            self._features_by_id[artcc_key] = feature
+
+            rings = _exterior_rings(feature.get('geometry', {}))
+            self._rings_by_id[artcc_key] = rings
+            if rings:
+                self._bbox_by_id[artcc_key] = (
+                    min(min(ring_lons) for ring_lons, _ in rings),
+                    min(min(ring_lats) for _, ring_lats in rings),
+                    max(max(ring_lons) for ring_lons, _ in rings),
+                    max(max(ring_lats) for _, ring_lats in rings),
+                )
+                self._artcc_areas.append((artcc_id, self._bbox_by_id[artcc_key], rings))
+
     def get_artcc_polygon(self, artcc_id: str) -> Optional[List[Tuple[float, float]]]:
         """
         Get polygon coordinates for a specific ARTCC
@@ -50,19 +88,19 @@ class ARTCCBoundaries:
         """
         self._ensure_loaded()
 
-        for feature in self.boundaries_data.get('features', []):
-            if feature.get('properties', {}).get('id') == artcc_id.upper():
-                geometry = feature.get('geometry', {})
+        feature = self._features_by_id.get(artcc_id.upper())
+        if feature is not None:
+            geometry = feature.get('geometry', {})
 
-                if geometry.get('type') == 'Polygon':
-                    # Return first ring (exterior boundary)
-                    coords = geometry.get('coordinates', [[]])[0]
-                    return [(lon, lat) for lon, lat in coords]
+            if geometry.get('type') == 'Polygon':
+                # Return first ring (exterior boundary)
+                coords = geometry.get('coordinates', [[]])[0]
+                return [(lon, lat) for lon, lat in coords]
 
-                elif geometry.get('type') == 'MultiPolygon':
-                    # Return first polygon's exterior boundary
-                    coords = geometry.get('coordinates', [[[]]]) [0][0]
-                    return [(lon, lat) for lon, lat in coords]
+            elif geometry.get('type') == 'MultiPolygon':
+                # Return first polygon's exterior boundary
+                coords = geometry.get('coordinates', [[[]]]) [0][0]
+                return [(lon, lat) for lon, lat in coords]
 
         logger.warning(f"ARTCC {artcc_id} not found in boundaries data")
         return None
@@ -81,24 +119,44 @@ class ARTCCBoundaries:
         """
         self._ensure_loaded()
 
-        for feature in self.boundaries_data.get('features', []):
-            if feature.get('properties', {}).get('id') == artcc_id.upper():
-                geometry = feature.get('geometry', {})
-
-                if geometry.get('type') == 'Polygon':
-                    coords_ring = geometry.get('coordinates', [[]])[0]
-                    return point_in_polygon(lat, lon, coords_ring)
+        artcc_key = artcc_id.upper()
+        rings = self._rings_by_id.get(artcc_key)
+        if rings is None:
+            logger.warning(f"ARTCC {artcc_id} not found for point check")
+            return False
 
-                elif geometry.get('type') == 'MultiPolygon':
-                    for polygon in geometry.get('coordinates', []):
-                        coords_ring = polygon[0]
-                        if point_in_polygon(lat, lon, coords_ring):
-                            return True
-                    return False
+        # Most checks are far outside the ARTCC - reject those without walking the rings
+        bbox = self._bbox_by_id.get(artcc_key)
+        if bbox is None or not (bbox[0] <= lon <= bbox[2] and bbox[1] <= lat <= bbox[3]):
+            return False
 
-        logger.warning(f"ARTCC {artcc_id} not found for point check")
+        for ring_lons, ring_lats in rings:
+            if point_in_ring(lat, lon, ring_lons, ring_lats):
+                return True
         return False
 
+    def find_artcc_for_point(self, lat: float, lon: float) -> Optional[str]:
+        """
+        Find the ARTCC whose boundary contains a point
+
+        Args:
+            lat: Latitude
+            lon: Longitude
+
+        Returns:
+            ARTCC ID (e.g., "ZAB"), or None if the point is outside every boundary
+        """
+        self._ensure_loaded()
+
+        for artcc_id, (min_lon, min_lat, max_lon, max_lat), rings in self._artcc_areas:
+            if not (min_lon <= lon <= max_lon and min_lat <= lat <= max_lat):
+                continue
+            for ring_lons, ring_lats in rings:
+                if point_in_ring(lat, lon, ring_lons, ring_lats):
+                    return artcc_id
+
+        return None
+
     def get_all_artcc_ids(self) -> List[str]:
         """
         Get list of all available ARTCC identifiers
@@ -128,27 +186,17 @@ class ARTCCBoundaries:
         """
         self._ensure_loaded()
 
-        for feature in self.boundaries_data.get('features', []):
-            if feature.get('properties', {}).get('id') == artcc_id.upper():
-                bbox = feature.get('bbox')
-                if bbox and len(bbox) == 4:
-                    # GeoJSON bbox format: [min_lon, min_lat, max_lon, max_lat]
-                    return tuple(bbox)
-
-                # If no bbox, calculate from coordinates
-                geometry = feature.get('geometry', {})
-                coords = []
-
-                if geometry.get('type') == 'Polygon':
-                    coords = geometry.get('coordinates', [[]])[0]
-                elif geometry.get('type') == 'MultiPolygon':
-                    for polygon in geometry.get('coordinates', []):
-                        coords.extend(polygon[0])
-
-                if coords:
-                    lons = [c[0] for c in coords]
-                    lats = [c[1] for c in coords]
-                    return (min(lons), min(lats), max(lons), max(lats))
+        artcc_key = artcc_id.upper()
+        feature = self._features_by_id.get(artcc_key)
+        if feature is not None:
+            bbox = feature.get('bbox')
+            if bbox and len(bbox) == 4:
+                # GeoJSON bbox format: [min_lon, min_lat, max_lon, max_lat]
+                return tuple(bbox)
+
+            # If no bbox, use the extent calculated from the exterior rings at load
+            if artcc_key in self._bbox_by_id:
+                return self._bbox_by_id[artcc_key]
 
         logger.warning(f"ARTCC {artcc_id} not found for bbox calculation")
         return None
@@ -173,6 +221,26 @@ class ARTCCBoundaries:
         return None
 
 
+def _exterior_rings(geometry: Dict) -> List[Tuple[Tuple[float, ...], Tuple[float, ...]]]:
+    """
+    Extract the exterior ring of each polygon in a GeoJSON geometry
+
+    Args:
+        geometry: GeoJSON Polygon or MultiPolygon geometry
+
+    Returns:
+        List of (longitudes, latitudes) tuples, one per polygon
+    """
+    if geometry.get('type') == 'Polygon':
+        polygons = [geometry.get('coordinates', [[]])]
+    elif geometry.get('type') == 'MultiPolygon':
+        polygons = geometry.get('coordinates', [])
+    else:
+        return []
+
+    return [split_ring(polygon[0]) for polygon in polygons if polygon and polygon[0]]
+
+
 # Global singleton instance
 _global_artcc_boundaries = None
 
@@ -2,6 +2,7 @@
 Update checker module for checking updates from GitHub
 """
 import requests
+import json
 import logging
 from pathlib import Path
 from packaging import version as version_parser
@@ -17,11 +18,32 @@ def is_standalone_executable():
 class AutoUpdater:
     """Handles update checking from GitHub releases"""
 
+    # Last releases response and its ETag, so unchanged releases come back as a bodiless 304
+    RELEASES_CACHE_PATH = Path.home() / ".cache" / "ssg" / "releases.json"
+
     def __init__(self, repo_owner="braukStauter", repo_name="Sweatbox-Scenario-Generator--SSG-"):
         self.repo_owner = repo_owner
         self.repo_name = repo_name
         self.api_url = f"https://api.github.com/repos/{repo_owner}/{repo_name}/releases"
 
+    def _load_cached_releases(self):
+        """Load the cached releases response, or an empty dict if there is none"""
+        try:
+            with open(self.RELEASES_CACHE_PATH, 'r') as f:
+                cached = json.load(f)
+            return cached if isinstance(cached, dict) else {}
+        except (OSError, ValueError):
+            return {}
+
+    def _save_cached_releases(self, etag, releases):
+        """Save a releases response with its ETag (failures only cost a full request next time)"""
+        try:
+            self.RELEASES_CACHE_PATH.parent.mkdir(parents=True, exist_ok=True)
+            with open(self.RELEASES_CACHE_PATH, 'w') as f:
+                json.dump({'etag': etag, 'releases': releases}, f)
+        except (OSError, TypeError) as e:
+            logger.debug(f"Could not cache releases response: {e}")
+
     def get_current_version(self):
         """Get the current installed version"""
         try:
@@ -49,17 +71,32 @@ class AutoUpdater:
 
         try:
             logger.info(f"Checking for updates at {self.api_url}")
-            response = requests.get(self.api_url, timeout=10)
 
-            if response.status_code == 404:
-                logger.info("No releases found on GitHub")
-                return False, None
+            # Conditional request - a 304 reply has no body and doesn't count against the rate limit
+            cached = self._load_cached_releases()
+            headers = {}
+            if cached.get('etag') and 'releases' in cached:
+                headers['If-None-Match'] = cached['etag']
 
-            if response.status_code != 200:
-                logger.error(f"GitHub API returned status {response.status_code}")
-                return False, None
+            response = requests.get(self.api_url, headers=headers, timeout=10)
+
+            if response.status_code == 304 and headers:
+                logger.info("Releases unchanged since last check, using cached response")
+                releases = cached['releases']
+            else:
+                if response.status_code == 404:
+                    logger.info("No releases found on GitHub")
+                    return False, None
+
+                if response.status_code != 200:
+                    logger.error(f"GitHub API returned status {response.status_code}")
+                    return False, None
+
+                releases = response.json()
 
-            releases = response.json()
+                etag = response.headers.get('ETag')
+                if etag:
+                    self._save_cached_releases(etag, releases)
 
             # Filter out draft releases and get the latest release
             valid_releases = [r for r in releases if not r.get('draft', False)]
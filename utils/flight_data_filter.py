@@ -1,12 +1,26 @@
 """
 Flight data filtering utilities for validating and categorizing API flight data
 """
+from functools import lru_cache
 from typing import List, Dict, Any, Optional, Tuple
 import logging
 import re
 
 logger = logging.getLogger(__name__)
 
+# SID/STAR names are alphanumeric with a trailing number (e.g., MNZNO3, JFRYE5)
+_PROCEDURE_PATTERN = re.compile(r'^[A-Z0-9]{4,7}\d$')
+# Alphabetic airline prefix of a callsign (e.g., SWA in SWA1156)
+_AIRLINE_PREFIX_PATTERN = re.compile(r'^([A-Z]{2,3})')
+# Time suffix at the end of an API route (e.g., /0220)
+_TIME_SUFFIX_PATTERN = re.compile(r'/\d{4}$')
+# First letters of ICAO airport codes stripped from the ends of API routes
+_ICAO_FIRST_LETTERS = frozenset('KPCMTYNZWSVR')
+# Trailing digits of a procedure name (e.g., the '6' in 'EAGUL6')
+_TRAILING_DIGITS_PATTERN = re.compile(r'\d+$')
+# Delimiters between route elements
+_ROUTE_DELIMITER_PATTERN = re.compile(r'[.\s/]')
+
 
 def is_valid_flight(flight: Dict[str, Any]) -> bool:
     """
@@ -18,20 +32,22 @@ def is_valid_flight(flight: Dict[str, Any]) -> bool:
     Returns:
         True if flight is valid, False otherwise
     """
-    # Must have aircraft identification
-    if not flight.get('aircraftIdentification'):
-        logger.debug(f"Flight missing aircraftIdentification: {flight.get('gufi')}")
-        return False
+    get = flight.get
 
     # Must have complete route
-    route = flight.get('route', '')
-    if not route or route.strip() == '':
-        logger.debug(f"Flight {flight.get('aircraftIdentification')} missing route")
+    route = get('route', '')
+    if not route or route.isspace():
+        logger.debug(f"Flight {get('aircraftIdentification')} missing route")
+        return False
+
+    # Must have aircraft identification
+    if not get('aircraftIdentification'):
+        logger.debug(f"Flight missing aircraftIdentification: {get('gufi')}")
         return False
 
     # Must have aircraft type
-    if not flight.get('aircraftType'):
-        logger.debug(f"Flight {flight.get('aircraftIdentification')} missing aircraftType")
+    if not get('aircraftType'):
+        logger.debug(f"Flight {get('aircraftIdentification')} missing aircraftType")
         return False
 
     return True
@@ -65,13 +81,22 @@ def is_ga_aircraft(flight: Dict[str, Any]) -> bool:
     Returns:
         True if GA aircraft (N-number format), False if airline
     """
-    callsign = flight.get('aircraftIdentification', '')
+    return _is_n_number(flight.get('aircraftIdentification', ''))
 
-    # GA aircraft have N-number format (e.g., N12345, N123AB)
-    # Pattern: starts with 'N' followed by 1-5 alphanumeric characters
-    ga_pattern = re.compile(r'^N[A-Z0-9]{1,5}$', re.IGNORECASE)
 
-    return bool(ga_pattern.match(callsign))
+def _is_n_number(callsign: str) -> bool:
+    """
+    Check if a callsign is a US N-number (e.g., N12345, N123AB)
+
+    Args:
+        callsign: Aircraft callsign
+
+    Returns:
+        True if callsign is 'N' (either case) followed by 1-5 ASCII letters or digits
+    """
+    # Plain string checks instead of a regex - this runs for every flight when categorizing
+    tail = callsign[1:]
+    return callsign[:1] in ('N', 'n') and 0 < len(tail) <= 5 and tail.isascii() and tail.isalnum()
 
 
 def categorize_flights(flights: List[Dict[str, Any]]) -> Tuple[List[Dict[str, Any]], List[Dict[str, Any]]]:
@@ -86,18 +111,58 @@ def categorize_flights(flights: List[Dict[str, Any]]) -> Tuple[List[Dict[str, An
     """
     ga_flights = []
     airline_flights = []
+    add_ga = ga_flights.append
+    add_airline = airline_flights.append
 
     for flight in flights:
-        if is_ga_aircraft(flight):
-            ga_flights.append(flight)
+        if _is_n_number(flight.get('aircraftIdentification', '')):
+            add_ga(flight)
         else:
-            airline_flights.append(flight)
+            add_airline(flight)
 
     logger.debug(f"Categorized {len(flights)} flights: {len(ga_flights)} GA, {len(airline_flights)} airline")
 
     return ga_flights, airline_flights
 
 
+def filter_and_categorize_flights(
+    flights: List[Dict[str, Any]]
+) -> Tuple[List[Dict[str, Any]], List[Dict[str, Any]]]:
+    """
+    Filter out invalid flights and separate the rest into GA and airline categories
+
+    Equivalent to categorize_flights(filter_valid_flights(flights)), but done in a
+    single pass without building the intermediate list of valid flights.
+
+    Args:
+        flights: List of flight dictionaries from API
+
+    Returns:
+        Tuple of (ga_flights, airline_flights)
+    """
+    ga_flights = []
+    airline_flights = []
+    add_ga = ga_flights.append
+    add_airline = airline_flights.append
+
+    for flight in flights:
+        if not is_valid_flight(flight):
+            continue
+        if _is_n_number(flight.get('aircraftIdentification', '')):
+            add_ga(flight)
+        else:
+            add_airline(flight)
+
+    valid_count = len(ga_flights) + len(airline_flights)
+    if valid_count < len(flights):
+        logger.info(f"Filtered {len(flights) - valid_count} invalid flights, {valid_count} remain")
+
+    logger.debug(f"Categorized {valid_count} flights: {len(ga_flights)} GA, {len(airline_flights)} airline")
+
+    return ga_flights, airline_flights
+
+
+@lru_cache(maxsize=4096)
 def extract_sid_from_route(route: str) -> Optional[str]:
     """
     Extract SID name from a route string
@@ -123,9 +188,7 @@ def extract_sid_from_route(route: str) -> Optional[str]:
 
     # SID names are typically alphanumeric with numbers at the end (e.g., MNZNO3, JFRYE5)
     # Exclude waypoint-looking names (all uppercase, 5 chars, no numbers)
-    sid_pattern = re.compile(r'^[A-Z0-9]{4,7}\d$')
-
-    if sid_pattern.match(potential_sid):
+    if _PROCEDURE_PATTERN.match(potential_sid):
         return potential_sid
 
     return None
@@ -153,14 +216,25 @@ def extract_star_from_route(route: str) -> Optional[str]:
         part = parts[i].split('/')[0]  # Remove time suffix if present
 
         # STAR names are similar to SID names
-        star_pattern = re.compile(r'^[A-Z0-9]{4,7}\d$')
-
-        if star_pattern.match(part):
+        if _PROCEDURE_PATTERN.match(part):
             return part
 
     return None
 
 
+def strip_procedure_number(procedure: str) -> str:
+    """
+    Strip the numeric suffix from a procedure name (e.g., 'EAGUL6' -> 'EAGUL')
+
+    Args:
+        procedure: SID/STAR name with optional numeric suffix
+
+    Returns:
+        Procedure name without numeric suffix
+    """
+    return _TRAILING_DIGITS_PATTERN.sub('', procedure)
+
+
 def route_contains_waypoint(route: str, waypoint: str) -> bool:
     """
     Check if a route contains a specific waypoint
@@ -177,7 +251,7 @@ def route_contains_waypoint(route: str, waypoint: str) -> bool:
     waypoint_upper = waypoint.upper()
 
     # Split by common route delimiters
-    route_elements = re.split(r'[.\s/]', route_upper)
+    route_elements = _ROUTE_DELIMITER_PATTERN.split(route_upper)
 
     return waypoint_upper in route_elements
 
@@ -202,11 +276,12 @@ def filter_by_parking_airline(
     # Separate preferred and other flights
     preferred = []
     others = []
+    preferred_set = frozenset(preferred_airlines)
 
     for flight in flights:
         operator = flight.get('operator', '')
 
-        if operator in preferred_airlines:
+        if operator in preferred_set:
             preferred.append(flight)
         else:
             others.append(flight)
@@ -229,12 +304,12 @@ def get_airline_from_callsign(callsign: str) -> Optional[str]:
     Returns:
         Airline ICAO code or None if GA aircraft
     """
-    if is_ga_aircraft({'aircraftIdentification': callsign}):
+    if _is_n_number(callsign):
         return None
 
     # Airline callsigns typically have 3-letter prefix followed by numbers
     # Extract the alphabetic prefix
-    match = re.match(r'^([A-Z]{2,3})', callsign.upper())
+    match = _AIRLINE_PREFIX_PATTERN.match(callsign.upper())
 
     if match:
         return match.group(1)
@@ -242,6 +317,7 @@ def get_airline_from_callsign(callsign: str) -> Optional[str]:
     return None
 
 
+@lru_cache(maxsize=4096)
 def clean_route_string(route: str) -> str:
     """
     Clean a route string from API format to vNAS format
@@ -269,7 +345,7 @@ def clean_route_string(route: str) -> str:
         return ''
 
     # Remove time suffix (e.g., /0220)
-    route = re.sub(r'/\d{4}$', '', route)
+    route = _TIME_SUFFIX_PATTERN.sub('', route)
 
     # Split by dots
     parts = route.split('.')
@@ -281,11 +357,11 @@ def clean_route_string(route: str) -> str:
         return ''
 
     # Remove departure airport (first element if it's a 4-letter ICAO code starting with K, P, C, etc.)
-    if parts and len(parts[0]) == 4 and parts[0][0] in 'KPCMTYNZWSVR':
+    if parts and len(parts[0]) == 4 and parts[0][0] in _ICAO_FIRST_LETTERS:
         parts = parts[1:]
 
     # Remove arrival airport (last element if it's a 4-letter ICAO code)
-    if parts and len(parts[-1]) == 4 and parts[-1][0] in 'KPCMTYNZWSVR':
+    if parts and len(parts[-1]) == 4 and parts[-1][0] in _ICAO_FIRST_LETTERS:
         parts = parts[:-1]
 
     # Join with spaces and clean up
@@ -2,7 +2,8 @@
 Geographic utilities for coordinate calculations
 """
 import math
-from typing import Tuple
+from functools import lru_cache
+from typing import List, Tuple
 
 
 def nm_to_degrees(nm: float) -> float:
@@ -18,6 +19,25 @@ def nm_to_degrees(nm: float) -> float:
     return nm / 60.0
 
 
+@lru_cache(maxsize=1024)
+def _origin_trig(lat: float, lon: float) -> Tuple[float, float, float, float]:
+    """
+    Get the radian coordinates and latitude sine/cosine of an origin point
+
+    Cached because destinations are usually projected from the same few
+    origins (airport reference points, runway thresholds, fixes).
+
+    Args:
+        lat: Latitude in degrees
+        lon: Longitude in degrees
+
+    Returns:
+        (lat_rad, lon_rad, sin_lat, cos_lat) tuple
+    """
+    lat_rad = math.radians(lat)
+    return lat_rad, math.radians(lon), math.sin(lat_rad), math.cos(lat_rad)
+
+
 def calculate_destination(lat: float, lon: float, heading: int, distance_nm: float) -> Tuple[float, float]:
     """
     Calculate destination coordinates given start point, heading, and distance
@@ -32,22 +52,24 @@ def calculate_destination(lat: float, lon: float, heading: int, distance_nm: flo
         (latitude, longitude) tuple
     """
     # Convert to radians
-    lat_rad = math.radians(lat)
-    lon_rad = math.radians(lon)
+    lat_rad, lon_rad, sin_lat, cos_lat = _origin_trig(lat, lon)
     heading_rad = math.radians(heading)
 
     # Earth's radius in nautical miles
     R = 3440.065
 
+    # Angular distance, computed once and reused below
+    angular_distance = distance_nm / R
+    sin_d = math.sin(angular_distance)
+    cos_d = math.cos(angular_distance)
+
     # Calculate destination
-    lat2_rad = math.asin(
-        math.sin(lat_rad) * math.cos(distance_nm / R) +
-        math.cos(lat_rad) * math.sin(distance_nm / R) * math.cos(heading_rad)
-    )
+    sin_lat2 = sin_lat * cos_d + cos_lat * sin_d * math.cos(heading_rad)
+    lat2_rad = math.asin(sin_lat2)
 
     lon2_rad = lon_rad + math.atan2(
-        math.sin(heading_rad) * math.sin(distance_nm / R) * math.cos(lat_rad),
-        math.cos(distance_nm / R) - math.sin(lat_rad) * math.sin(lat2_rad)
+        math.sin(heading_rad) * sin_d * cos_lat,
+        cos_d - sin_lat * math.sin(lat2_rad)
     )
 
     # Convert back to degrees
@@ -86,11 +108,12 @@ def calculate_bearing(lat1: float, lon1: float, lat2: float, lon2: float) -> int
     return int(bearing)
 
 
-def calculate_distance_nm(lat1: float, lon1: float, lat2: float, lon2: float) -> float:
+def _haversine_nm(cos_lat1: float, lat1: float, lon1: float, lat2: float, lon2: float) -> float:
     """
-    Calculate distance between two points using Haversine formula
+    Haversine distance kernel shared by the distance helpers
 
     Args:
+        cos_lat1: Cosine of the starting latitude (in radians), so callers can reuse it
         lat1: Starting latitude in degrees
         lon1: Starting longitude in degrees
         lat2: Ending latitude in degrees
@@ -99,15 +122,14 @@ def calculate_distance_nm(lat1: float, lon1: float, lat2: float, lon2: float) ->
     Returns:
         Distance in nautical miles
     """
-    # Convert to radians
-    lat1_rad = math.radians(lat1)
-    lat2_rad = math.radians(lat2)
     dlat = math.radians(lat2 - lat1)
     dlon = math.radians(lon2 - lon1)
 
-    # Haversine formula
-    a = math.sin(dlat / 2) ** 2 + \
-        math.cos(lat1_rad) * math.cos(lat2_rad) * math.sin(dlon / 2) ** 2
+    # Haversine formula (squares written as products to avoid float pow)
+    sin_half_dlat = math.sin(dlat * 0.5)
+    sin_half_dlon = math.sin(dlon * 0.5)
+    a = sin_half_dlat * sin_half_dlat + \
+        cos_lat1 * math.cos(math.radians(lat2)) * (sin_half_dlon * sin_half_dlon)
     c = 2 * math.asin(math.sqrt(a))
 
     # Earth's radius in nautical miles
@@ -116,6 +138,22 @@ def calculate_distance_nm(lat1: float, lon1: float, lat2: float, lon2: float) ->
     return R * c
 
 
+def calculate_distance_nm(lat1: float, lon1: float, lat2: float, lon2: float) -> float:
+    """
+    Calculate distance between two points using Haversine formula
+
+    Args:
+        lat1: Starting latitude in degrees
+        lon1: Starting longitude in degrees
+        lat2: Ending latitude in degrees
+        lon2: Ending longitude in degrees
+
+    Returns:
+        Distance in nautical miles
+    """
+    return _haversine_nm(math.cos(math.radians(lat1)), lat1, lon1, lat2, lon2)
+
+
 def get_reciprocal_heading(heading: int) -> int:
     """
     Get the reciprocal (opposite) heading
@@ -126,5 +164,23 @@ def get_reciprocal_heading(heading: int) -> int:
     Returns:
         Reciprocal heading (0-360)
     """
-    reciprocal = (heading + 180) % 360
-    return reciprocal
+    return (heading + 180) % 360
+
+
+def calculate_distance_nm_batch(lat: float, lon: float, points: List[Tuple[float, float]]) -> List[float]:
+    """
+    Calculate distances from one point to many points
+
+    Equivalent to calling calculate_distance_nm(lat, lon, ...) for each point, with the
+    origin's latitude cosine computed once.
+
+    Args:
+        lat: Origin latitude in degrees
+        lon: Origin longitude in degrees
+        points: List of (lat, lon) tuples in degrees
+
+    Returns:
+        List of distances in nautical miles, in the same order as points
+    """
+    cos_lat1 = math.cos(math.radians(lat))
+    return [_haversine_nm(cos_lat1, lat, lon, lat2, lon2) for lat2, lon2 in points]
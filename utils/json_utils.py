@@ -0,0 +1,10 @@
+"""
+JSON decoding shared by the config, boundary and API loaders
+"""
+try:
+    import orjson
+    json_loads = orjson.loads
+except ImportError:
+    # orjson is optional - the standard library parser accepts the same bytes
+    import json
+    json_loads = json.loads
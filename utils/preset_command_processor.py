@@ -7,7 +7,7 @@ including variable substitution and group matching.
 
 import random
 import re
-from typing import List
+from typing import Dict, List, Optional
 from models.aircraft import Aircraft
 from models.preset_command import PresetCommandRule
 
@@ -86,8 +86,33 @@ VARIABLE_MAP = {
     "$tail": "registration",
 }
 
+# Single pattern matching any known variable, with alternatives sorted by length
+# (longest first) to avoid partial replacements - this prevents $arr from matching inside $arrival
+_VARIABLE_PATTERN = re.compile(
+    '|'.join(re.escape(variable) for variable in sorted(VARIABLE_MAP, key=len, reverse=True))
+)
 
-def substitute_variables(command_template: str, aircraft: Aircraft) -> str:
+
+def _format_variable_value(value) -> str:
+    """
+    Format an aircraft attribute value for use in a command.
+
+    Args:
+        value: Attribute value from the aircraft
+
+    Returns:
+        String value, or "N/A" if the value is None or empty
+    """
+    if value is None or value == "":
+        return "N/A"
+    if isinstance(value, float):
+        # Format floats to reasonable precision
+        return f"{value:.2f}"
+    return str(value)
+
+
+def substitute_variables(command_template: str, aircraft: Aircraft,
+                         value_cache: Optional[Dict[str, str]] = None) -> str:
     """
     Substitute variables in a command template with actual aircraft values.
 
@@ -97,34 +122,27 @@ def substitute_variables(command_template: str, aircraft: Aircraft) -> str:
     Args:
         command_template: Command string with variables (e.g., "SAYF THIS IS $aid")
         aircraft: Aircraft object to extract values from
+        value_cache: Optional dict of formatted attribute values for this aircraft,
+            filled in as variables are resolved so later templates can reuse them
 
     Returns:
         Command string with all variables replaced with actual values
     """
-    result = command_template
+    if value_cache is None:
+        value_cache = {}
 
-    # Sort variables by length (longest first) to avoid partial replacements
-    # This prevents $arr from matching inside $arrival
-    sorted_variables = sorted(VARIABLE_MAP.items(), key=lambda x: len(x[0]), reverse=True)
+    def replace_variable(match):
+        attribute = VARIABLE_MAP[match.group(0)]
 
-    for variable, attribute in sorted_variables:
-        if variable in result:
-            # Get the attribute value from the aircraft
-            value = getattr(aircraft, attribute, None)
+        # Get the formatted attribute value from the aircraft
+        value_str = value_cache.get(attribute)
+        if value_str is None:
+            value_str = _format_variable_value(getattr(aircraft, attribute, None))
+            value_cache[attribute] = value_str
+        return value_str
 
-            # Convert to string, handle None/empty values
-            if value is None or value == "":
-                value_str = "N/A"
-            elif isinstance(value, float):
-                # Format floats to reasonable precision
-                value_str = f"{value:.2f}"
-            else:
-                value_str = str(value)
-
-            # Replace the variable
-            result = result.replace(variable, value_str)
-
-    return result
+    # Replace all variables in one pass over the template
+    return _VARIABLE_PATTERN.sub(replace_variable, command_template)
 
 
 def _expand_gate_range(range_str: str) -> List[str]:
@@ -220,13 +238,15 @@ def _matches_parking_pattern(parking_spot: str, pattern: str) -> bool:
     return False
 
 
-def matches_rule(aircraft: Aircraft, rule: PresetCommandRule) -> bool:
+def matches_rule(aircraft: Aircraft, rule: PresetCommandRule,
+                 route_upper: Optional[str] = None) -> bool:
     """
     Check if an aircraft matches a preset command rule's grouping criteria.
 
     Args:
         aircraft: Aircraft to check
         rule: Preset command rule with group_type and group_value
+        route_upper: Optional precomputed upper-cased route string for the aircraft
 
     Returns:
         True if the aircraft matches the rule's criteria, False otherwise
@@ -236,21 +256,20 @@ def matches_rule(aircraft: Aircraft, rule: PresetCommandRule) -> bool:
 
     elif rule.group_type == "airline":
         # Match by operator/airline code
-        return aircraft.operator and aircraft.operator.upper() == rule.group_value.upper()
+        return aircraft.operator and aircraft.operator.upper() == rule.match_value
 
     elif rule.group_type == "destination":
         # Match by arrival airport
-        return aircraft.arrival and aircraft.arrival.upper() == rule.group_value.upper()
+        return aircraft.arrival and aircraft.arrival.upper() == rule.match_value
 
     elif rule.group_type == "origin":
         # Match by departure airport
-        return aircraft.departure and aircraft.departure.upper() == rule.group_value.upper()
+        return aircraft.departure and aircraft.departure.upper() == rule.match_value
 
     elif rule.group_type == "aircraft_type":
         # Match by aircraft type (remove equipment suffix for comparison)
         aircraft_base_type = aircraft.aircraft_type.split('/')[0] if aircraft.aircraft_type else ""
-        rule_base_type = rule.group_value.split('/')[0] if rule.group_value else ""
-        return aircraft_base_type.upper() == rule_base_type.upper()
+        return aircraft_base_type.upper() == rule.match_value
 
     elif rule.group_type == "departures":
         # Departures have parking spots
@@ -274,12 +293,10 @@ def matches_rule(aircraft: Aircraft, rule: PresetCommandRule) -> bool:
             return False
 
         # Check if the SID appears in the route (case-insensitive)
-        route_upper = aircraft.route.upper()
-        sid_upper = rule.group_value.upper()
+        sid_upper = rule.match_value
 
-        # Look for the SID in the route string
         # SIDs typically appear after "KDEN." at the start (e.g., "KDEN.BAYLR6.TEHRU")
-        match_result = sid_upper in route_upper
+        match_result = sid_upper in (route_upper if route_upper is not None else aircraft.route.upper())
 
         import logging
         logger = logging.getLogger(__name__)
@@ -296,12 +313,10 @@ def matches_rule(aircraft: Aircraft, rule: PresetCommandRule) -> bool:
             return False
 
         # Check if the STAR appears in the route (case-insensitive)
-        route_upper = aircraft.route.upper()
-        star_upper = rule.group_value.upper()
+        star_upper = rule.match_value
 
-        # Look for the STAR in the route string
         # STARs typically appear before the arrival airport (e.g., "...BRWRY.LAWGR4.KDEN")
-        match_result = star_upper in route_upper
+        match_result = star_upper in (route_upper if route_upper is not None else aircraft.route.upper())
 
         import logging
         logger = logging.getLogger(__name__)
@@ -319,11 +334,13 @@ def apply_preset_commands(aircraft_list: List[Aircraft], command_rules: List[Pre
     """
     Apply preset commands to aircraft based on rules.
 
-    Commands are applied cumulatively (aircraft can receive multiple commands).
+    Commands are applied cumulatively (aircraft can receive multiple commands, but an
+    identical command is only added once per aircraft).
     Rules are sorted by specificity (general → specific) before application.
 
     Special handling for 'random' group_type:
-    - Randomly selects N aircraft (where N = group_value) and applies command to them
+    - Randomly selects N aircraft (where N = group_value, capped at the number of aircraft)
+      and applies command to them
     - Random selection is independent for each random rule
 
     Args:
@@ -339,26 +356,55 @@ def apply_preset_commands(aircraft_list: List[Aircraft], command_rules: List[Pre
     # Sort rules by specificity (general commands applied first)
     sorted_rules = sorted(command_rules, key=lambda r: r.get_specificity_score())
 
+    # Formatted variable values per aircraft, shared by every rule in this pass
+    value_caches = {id(aircraft): {} for aircraft in aircraft_list}
+
+    # Commands already on each aircraft, so overlapping rules don't queue the same command twice
+    applied_commands = {id(aircraft): set(aircraft.preset_commands) for aircraft in aircraft_list}
+
+    def add_command(aircraft: Aircraft, rule: PresetCommandRule):
+        """Substitute a rule's command for an aircraft and queue it if not already present"""
+        command = substitute_variables(rule.command_template, aircraft, value_caches[id(aircraft)])
+        if command not in applied_commands[id(aircraft)]:
+            applied_commands[id(aircraft)].add(command)
+            aircraft.preset_commands.append(command)
+
+    # Upper-cased routes for SID/STAR rules - built on the first such rule, then reused
+    routes_upper = None
+
+    # Group types that match a whole bucket of aircraft (departures have parking spots,
+    # arrivals don't) - split once so these rules skip the per-aircraft checks
+    aircraft_by_group_type = {
+        "all": aircraft_list,
+        "departures": [aircraft for aircraft in aircraft_list if aircraft.parking_spot_name],
+        "arrivals": [aircraft for aircraft in aircraft_list if not aircraft.parking_spot_name],
+    }
+
     for rule in sorted_rules:
         if rule.group_type == "random":
             # Special handling for random selection
             try:
                 count = int(rule.group_value)
-                # Randomly select N aircraft
-                if count > 0 and count <= len(aircraft_list):
-                    selected_aircraft = random.sample(aircraft_list, count)
-                    for aircraft in selected_aircraft:
-                        command = substitute_variables(rule.command_template, aircraft)
-                        aircraft.preset_commands.append(command)
             except (ValueError, TypeError):
                 # Invalid count value, skip this rule
                 continue
+
+            # Randomly select N aircraft in a single draw (every aircraft if there are fewer than N)
+            if count > 0:
+                for aircraft in random.sample(aircraft_list, min(count, len(aircraft_list))):
+                    add_command(aircraft, rule)
+        elif rule.group_type in aircraft_by_group_type:
+            # Every aircraft in the bucket matches
+            for aircraft in aircraft_by_group_type[rule.group_type]:
+                add_command(aircraft, rule)
         else:
             # Normal matching for other group types
+            if routes_upper is None and rule.group_type in ("sid", "star"):
+                routes_upper = {id(aircraft): aircraft.route.upper() for aircraft in aircraft_list if aircraft.route}
             for aircraft in aircraft_list:
-                if matches_rule(aircraft, rule):
-                    command = substitute_variables(rule.command_template, aircraft)
-                    aircraft.preset_commands.append(command)
+                route_upper = routes_upper.get(id(aircraft)) if routes_upper is not None else None
+                if matches_rule(aircraft, rule, route_upper):
+                    add_command(aircraft, rule)
 
 
 def get_available_variables() -> List[str]:
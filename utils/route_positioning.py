@@ -9,6 +9,7 @@ import math
 from typing import Optional, List, Tuple, Dict
 from utils.waypoint_database import get_waypoint_database
 from utils.artcc_utils import get_artcc_boundaries
+from utils.geo_utils import calculate_distance_nm, calculate_distance_nm_batch
 
 logger = logging.getLogger(__name__)
 
@@ -189,24 +190,7 @@ class RouteParser:
         Returns:
             Distance in nautical miles
         """
-        # Haversine formula
-        lat1_rad = math.radians(lat1)
-        lat2_rad = math.radians(lat2)
-        dLat = math.radians(lat2 - lat1)
-        dLon = math.radians(lon2 - lon1)
-
-        a = math.sin(dLat/2) * math.sin(dLat/2) + \
-            math.cos(lat1_rad) * math.cos(lat2_rad) * \
-            math.sin(dLon/2) * math.sin(dLon/2)
-
-        c = 2 * math.atan2(math.sqrt(a), math.sqrt(1-a))
-
-        # Earth radius in nautical miles
-        R = 3440.065
-
-        distance = R * c
-
-        return distance
+        return calculate_distance_nm(lat1, lon1, lat2, lon2)
 
     def find_nearest_waypoint_to_position(self, lat: float, lon: float, waypoints: List[Tuple[str, float, float]]) -> Optional[Tuple[str, float, float]]:
         """
@@ -222,16 +206,11 @@ class RouteParser:
         if not waypoints:
             return None
 
-        min_distance = float('inf')
-        nearest_waypoint = None
-
-        for wp_name, wp_lat, wp_lon in waypoints:
-            distance = self.calculate_distance(lat, lon, wp_lat, wp_lon)
-            if distance < min_distance:
-                min_distance = distance
-                nearest_waypoint = (wp_name, wp_lat, wp_lon)
+        distances = calculate_distance_nm_batch(lat, lon, [(wp_lat, wp_lon) for _, wp_lat, wp_lon in waypoints])
+        nearest_index = min(range(len(waypoints)), key=distances.__getitem__)
 
-        return nearest_waypoint
+        wp_name, wp_lat, wp_lon = waypoints[nearest_index]
+        return (wp_name, wp_lat, wp_lon)
 
     def generate_frd_position(self, lat: float, lon: float, route_coords: List[Tuple[str, float, float]]) -> str:
         """
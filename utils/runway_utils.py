@@ -169,13 +169,22 @@ def identify_crossing_converging_runways(runways: List[Runway], max_centerline_d
 
     logger.debug(f"Analyzing {len(runway_ends)} runway ends for crossing/converging relationships")
 
-    # Compare each pair of runway ends
+    # Centerline direction vectors are fixed per runway end - compute them once, not per pair
+    directions = [_centerline_direction(heading) for _, _, heading, _, _ in runway_ends]
+
+    # Only pairs whose surface + extended centerline envelopes overlap can cross or converge
+    envelopes = [
+        _runway_end_envelope(coords, threshold, directions[i], max_centerline_distance_nm)
+        for i, (_, coords, _, threshold, _) in enumerate(runway_ends)
+    ]
+    candidates = _overlapping_envelope_pairs(envelopes)
+
+    # Compare each candidate pair of runway ends
     for i, (end1, coords1, heading1, threshold1, runway1) in enumerate(runway_ends):
         crossings = []
 
-        for j, (end2, coords2, heading2, threshold2, runway2) in enumerate(runway_ends):
-            if i >= j:  # Skip self and already compared pairs
-                continue
+        for j in sorted(candidates[i]):
+            end2, coords2, heading2, threshold2, runway2 = runway_ends[j]
 
             # Skip if same physical runway (reciprocals like 8/26, 17/35)
             if runway1 == runway2:
@@ -197,7 +206,7 @@ def identify_crossing_converging_runways(runways: List[Runway], max_centerline_d
 
             physical_crossing = _check_actual_runway_crossing(coords1, coords2)
             centerline_crossing = _check_centerline_intersection(
-                threshold1, heading1, threshold2, heading2, max_centerline_distance_nm
+                threshold1, directions[i], threshold2, directions[j], max_centerline_distance_nm
             )
 
             if physical_crossing or centerline_crossing:
@@ -216,6 +225,94 @@ def identify_crossing_converging_runways(runways: List[Runway], max_centerline_d
     return crossing_map
 
 
+def _centerline_direction(heading: float) -> Tuple[float, float]:
+    """
+    Get the (dx, dy) direction vector of a runway centerline.
+
+    Uses the small angle approximation for local coordinates, with dx/dy in
+    degrees of longitude/latitude (approximate, but sufficient for intersection detection).
+
+    Args:
+        heading: Heading of the runway end in degrees
+
+    Returns:
+        (dx, dy) tuple
+    """
+    heading_rad = math.radians(heading)
+    return (math.sin(heading_rad), math.cos(heading_rad))
+
+
+def _runway_end_envelope(
+    coords: List[List[float]],
+    threshold: Tuple[float, float],
+    direction: Tuple[float, float],
+    max_distance_nm: float
+) -> Tuple[float, float, float, float]:
+    """
+    Get the bounding box covering a runway surface and its extended centerline.
+
+    Any physical or centerline intersection found for this runway end lies inside
+    this box, so runway ends with disjoint boxes can never be related.
+
+    Args:
+        coords: List of [lon, lat] coordinates for the runway (GeoJSON format)
+        threshold: (lat, lon) of the runway threshold
+        direction: (dx, dy) centerline direction vector
+        max_distance_nm: Maximum distance the centerline is extended
+
+    Returns:
+        (min_lon, min_lat, max_lon, max_lat) tuple
+    """
+    lat, lon = threshold
+
+    # Far end of the extended centerline, in the same degree units used by
+    # _check_centerline_intersection (1 unit of t = 60 NM)
+    reach = max_distance_nm / 60
+    dx, dy = direction
+    far_lat = lat + reach * dy
+    far_lon = lon + reach * dx
+
+    lons = (coords[0][0], coords[-1][0], lon, far_lon)
+    lats = (coords[0][1], coords[-1][1], lat, far_lat)
+
+    # Small pad so the tolerance used by the exact tests is never clipped
+    pad = 1e-6
+    return (min(lons) - pad, min(lats) - pad, max(lons) + pad, max(lats) + pad)
+
+
+def _overlapping_envelope_pairs(envelopes: List[Tuple[float, float, float, float]]) -> List[set]:
+    """
+    Find all pairs of envelopes that overlap.
+
+    Sweeps the envelopes in order of minimum longitude, keeping only those still
+    open at the current position, so the work is O(N log N + K) for K overlaps
+    instead of comparing every pair. Pairs open together are then kept only if
+    their latitude ranges overlap as well.
+
+    Args:
+        envelopes: List of (min_lon, min_lat, max_lon, max_lat) tuples
+
+    Returns:
+        List where entry i is the set of indices j > i that overlap envelope i
+    """
+    candidates = [set() for _ in envelopes]
+    active = []
+
+    for i in sorted(range(len(envelopes)), key=lambda k: envelopes[k][0]):
+        min_lon, min_lat, _, max_lat = envelopes[i]
+        active = [j for j in active if envelopes[j][2] >= min_lon]
+        for j in active:
+            if envelopes[j][3] < min_lat or max_lat < envelopes[j][1]:
+                continue
+            if i < j:
+                candidates[i].add(j)
+            else:
+                candidates[j].add(i)
+        active.append(i)
+
+    return candidates
+
+
 def _check_actual_runway_crossing(coords1: List[List[float]], coords2: List[List[float]]) -> bool:
     """
     Check if two runway surfaces actually intersect.
@@ -271,53 +368,52 @@ def _line_segments_intersect(
         True if segments intersect
     """
     # Using the orientation method for line segment intersection
-
-    def orientation(p1_lat, p1_lon, p2_lat, p2_lon, p3_lat, p3_lon):
-        """Find orientation of ordered triplet (p1, p2, p3).
-        Returns:
-        0: Colinear
-        1: Clockwise
-        2: Counterclockwise
-        """
-        val = (p2_lon - p1_lon) * (p3_lat - p2_lat) - (p2_lat - p1_lat) * (p3_lon - p2_lon)
-        if abs(val) < 1e-10:
-            return 0
-        return 1 if val > 0 else 2
-
-    def on_segment(p1_lat, p1_lon, p2_lat, p2_lon, p3_lat, p3_lon):
-        """Check if point p2 lies on segment p1-p3"""
-        if (min(p1_lat, p3_lat) <= p2_lat <= max(p1_lat, p3_lat) and
-            min(p1_lon, p3_lon) <= p2_lon <= max(p1_lon, p3_lon)):
-            return True
-        return False
-
-    o1 = orientation(lat1, lon1, lat2, lon2, lat3, lon3)
-    o2 = orientation(lat1, lon1, lat2, lon2, lat4, lon4)
-    o3 = orientation(lat3, lon3, lat4, lon4, lat1, lon1)
-    o4 = orientation(lat3, lon3, lat4, lon4, lat2, lon2)
+    o1 = _orientation(lat1, lon1, lat2, lon2, lat3, lon3)
+    o2 = _orientation(lat1, lon1, lat2, lon2, lat4, lon4)
+    o3 = _orientation(lat3, lon3, lat4, lon4, lat1, lon1)
+    o4 = _orientation(lat3, lon3, lat4, lon4, lat2, lon2)
 
     # General case: segments intersect if orientations differ
     if o1 != o2 and o3 != o4:
         return True
 
     # Special cases: colinear points
-    if o1 == 0 and on_segment(lat1, lon1, lat3, lon3, lat2, lon2):
+    if o1 == 0 and _on_segment(lat1, lon1, lat3, lon3, lat2, lon2):
         return True
-    if o2 == 0 and on_segment(lat1, lon1, lat4, lon4, lat2, lon2):
+    if o2 == 0 and _on_segment(lat1, lon1, lat4, lon4, lat2, lon2):
         return True
-    if o3 == 0 and on_segment(lat3, lon3, lat1, lon1, lat4, lon4):
+    if o3 == 0 and _on_segment(lat3, lon3, lat1, lon1, lat4, lon4):
         return True
-    if o4 == 0 and on_segment(lat3, lon3, lat2, lon2, lat4, lon4):
+    if o4 == 0 and _on_segment(lat3, lon3, lat2, lon2, lat4, lon4):
         return True
 
     return False
 
 
+def _orientation(p1_lat, p1_lon, p2_lat, p2_lon, p3_lat, p3_lon) -> int:
+    """Find orientation of ordered triplet (p1, p2, p3).
+    Returns:
+    0: Colinear
+    1: Clockwise
+    2: Counterclockwise
+    """
+    val = (p2_lon - p1_lon) * (p3_lat - p2_lat) - (p2_lat - p1_lat) * (p3_lon - p2_lon)
+    if abs(val) < 1e-10:
+        return 0
+    return 1 if val > 0 else 2
+
+
+def _on_segment(p1_lat, p1_lon, p2_lat, p2_lon, p3_lat, p3_lon) -> bool:
+    """Check if point p2 lies on segment p1-p3"""
+    return (min(p1_lat, p3_lat) <= p2_lat <= max(p1_lat, p3_lat) and
+            min(p1_lon, p3_lon) <= p2_lon <= max(p1_lon, p3_lon))
+
+
 def _check_centerline_intersection(
     threshold1: Tuple[float, float],
-    heading1: float,
+    direction1: Tuple[float, float],
     threshold2: Tuple[float, float],
-    heading2: float,
+    direction2: Tuple[float, float],
     max_distance_nm: float
 ) -> bool:
     """
@@ -328,29 +424,18 @@ def _check_centerline_intersection(
 
     Args:
         threshold1: (lat, lon) of first runway threshold
-        heading1: Heading of first runway in degrees
+        direction1: (dx, dy) centerline direction of first runway
         threshold2: (lat, lon) of second runway threshold
-        heading2: Heading of second runway in degrees
+        direction2: (dx, dy) centerline direction of second runway
         max_distance_nm: Maximum distance from either threshold to check
 
     Returns:
         True if centerlines intersect within max_distance_nm of either threshold
     """
-    import math
-
     lat1, lon1 = threshold1
     lat2, lon2 = threshold2
-
-    # Convert headings to radians
-    h1_rad = math.radians(heading1)
-    h2_rad = math.radians(heading2)
-
-    # Direction vectors (using small angle approximation for local coordinates)
-    # dx/dy in degrees (approximate, but sufficient for intersection detection)
-    dx1 = math.sin(h1_rad)
-    dy1 = math.cos(h1_rad)
-    dx2 = math.sin(h2_rad)
-    dy2 = math.cos(h2_rad)
+    dx1, dy1 = direction1
+    dx2, dy2 = direction2
 
     # Parametric lines: P1 + t1 * D1 and P2 + t2 * D2
     # Solve for intersection: lat1 + t1*dy1 = lat2 + t2*dy2
@@ -407,10 +492,5 @@ def calculate_diagonal_separation(
     # Along-track separation (difference in distances from threshold)
     along_track = abs(runway1_distance - runway2_distance)
 
-    # Perpendicular separation (runway centerline spacing)
-    perpendicular = centerline_spacing
-
-    # Diagonal separation (hypotenuse)
-    diagonal = math.sqrt(along_track**2 + perpendicular**2)
-
-    return diagonal
+    # Diagonal separation (hypotenuse of along-track and centerline spacing)
+    return math.hypot(along_track, centerline_spacing)
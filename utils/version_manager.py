@@ -125,12 +125,13 @@ class VersionManager:
         version = self.get_current_version()
         commit_hash = self.get_commit_hash()
         git_version = self.get_git_version()
+        commit_count = self.get_commit_count()
 
         # Use git version if available, otherwise use version.py
         if git_version:
             version = git_version
 
-        return version, commit_hash, str(self.get_commit_count()) if self.get_commit_count() > 0 else None
+        return version, commit_hash, str(commit_count) if commit_count > 0 else None
 
     def get_display_version(self) -> str:
         """